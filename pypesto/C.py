@@ -344,3 +344,5 @@ WATERFALL_MAX_VALUE = 1e100
 
 PYPESTO_MAX_N_STARTS: str = "PYPESTO_MAX_N_STARTS"
 PYPESTO_MAX_N_SAMPLES: str = "PYPESTO_MAX_N_SAMPLES"
+# fall back to a full deep copy of the problem in profiling
+PYPESTO_PROFILE_DEEPCOPY: str = "PYPESTO_PROFILE_DEEPCOPY"
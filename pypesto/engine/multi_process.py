@@ -3,6 +3,7 @@
 import logging
 import multiprocessing
 import os
+import weakref
 from typing import Any, Union
 
 import cloudpickle as pickle
@@ -35,6 +36,18 @@ class MultiProcessEngine(Engine):
     method:
         Start method, any of "fork", "spawn", "forkserver", or None,
         giving the system specific default context. Defaults to ``None``.
+
+    The process pool is created on the first call to :meth:`execute` and
+    reused by subsequent calls, avoiding the start-up cost of the worker
+    processes. The worker processes keep running until :meth:`close` is
+    called, so call it once the engine is no longer needed, or use the
+    engine as a context manager::
+
+        with MultiProcessEngine() as engine:
+            result = minimize(..., engine=engine)
+
+    As a fallback, the pool is terminated when the engine is garbage
+    collected or the interpreter shuts down.
     """
 
     def __init__(
@@ -52,6 +65,43 @@ class MultiProcessEngine(Engine):
         self.n_procs: int = n_procs
         self.method: str = method
 
+        self._pool = None
+        self._pool_size: int = 0
+        self._finalizer = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # process pools cannot be pickled
+        state["_pool"] = None
+        state["_pool_size"] = 0
+        state["_finalizer"] = None
+        return state
+
+    def _get_pool(self, n_procs: int):
+        """Get the cached process pool with at least `n_procs` processes."""
+        if self._pool is not None and self._pool_size < n_procs:
+            self.close()
+        if self._pool is None:
+            ctx = multiprocessing.get_context(method=self.method)
+            self._pool = ctx.Pool(processes=n_procs)
+            self._pool_size = n_procs
+            self._finalizer = weakref.finalize(self, self._pool.terminate)
+        return self._pool
+
+    def close(self) -> None:
+        """Terminate the cached process pool, if any."""
+        if self._finalizer is not None:
+            self._finalizer()
+        self._pool = None
+        self._pool_size = 0
+        self._finalizer = None
+
+    def __enter__(self) -> "MultiProcessEngine":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def execute(
         self, tasks: list[Task], progress_bar: bool = None
     ) -> list[Any]:
@@ -75,15 +125,13 @@ class MultiProcessEngine(Engine):
         n_procs = min(self.n_procs, n_tasks)
         logger.debug(f"Parallelizing on {n_procs} processes.")
 
-        ctx = multiprocessing.get_context(method=self.method)
-
-        with ctx.Pool(processes=n_procs) as pool:
-            results = list(
-                tqdm(
-                    pool.imap(work, pickled_tasks),
-                    total=len(pickled_tasks),
-                    enable=progress_bar,
-                ),
-            )
+        pool = self._get_pool(n_procs)
+        results = list(
+            tqdm(
+                pool.imap(work, pickled_tasks),
+                total=len(pickled_tasks),
+                enable=progress_bar,
+            ),
+        )
 
         return results
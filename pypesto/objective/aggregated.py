@@ -139,12 +139,23 @@ def aggregate_results(rvals: Sequence[ResultDict]) -> ResultDict:
     rvals:
         results to aggregate
     """
-    # sum over fval/grad/hess, if available in all rvals
-    result = {
-        key: sum(rval[key] for rval in rvals)
-        for key in [FVAL, GRAD, HESS, HESSP]
-        if all(key in rval for rval in rvals)
-    }
+    # sum over fval/grad/hess, if available in all rvals, accumulating
+    #  in place into a copy of the first value
+    result = {}
+    for key in (FVAL, GRAD, HESS, HESSP):
+        if not all(key in rval for rval in rvals):
+            continue
+        acc = rvals[0][key]
+        if isinstance(acc, np.ndarray):
+            acc = acc.astype(
+                np.result_type(*(rval[key] for rval in rvals)), copy=True
+            )
+        for rval in rvals[1:]:
+            if isinstance(acc, np.ndarray):
+                acc += rval[key]
+            else:
+                acc = acc + rval[key]
+        result[key] = acc
 
     # extract rdatas and flatten
     result[RDATAS] = []
@@ -152,28 +163,27 @@ def aggregate_results(rvals: Sequence[ResultDict]) -> ResultDict:
         if RDATAS in rval:
             result[RDATAS].extend(rval[RDATAS])
 
-    # initialize res and sres
+    # concatenate res and sres into pre-allocated buffers
     if RES in rvals[0]:
-        res = np.asarray(rvals[0][RES])
-    else:
-        res = None
-
+        result[RES] = _concatenate([rval[RES] for rval in rvals])
     if SRES in rvals[0]:
-        sres = np.asarray(rvals[0][SRES])
-    else:
-        sres = None
-
-    # skip iobj=0 after initialization, stack matrices
-    for rval in rvals[1:]:
-        if res is not None:
-            res = np.hstack([res, np.asarray(rval[RES])])
-        if sres is not None:
-            sres = np.vstack([sres, np.asarray(rval[SRES])])
-
-    # fill res, sres into result
-    if res is not None:
-        result[RES] = res
-    if sres is not None:
-        result[SRES] = sres
+        result[SRES] = _concatenate([rval[SRES] for rval in rvals])
 
     return result
+
+
+def _concatenate(arrays: Sequence[np.ndarray]) -> np.ndarray:
+    """Concatenate arrays along the first axis into a single new buffer."""
+    arrays = [np.asarray(array) for array in arrays]
+    if len(arrays) == 1:
+        return arrays[0]
+    sizes = [array.shape[0] for array in arrays]
+    out = np.empty(
+        (sum(sizes), *arrays[0].shape[1:]),
+        dtype=np.result_type(*arrays),
+    )
+    offset = 0
+    for size, array in zip(sizes, arrays):
+        out[offset : offset + size] = array
+        offset += size
+    return out
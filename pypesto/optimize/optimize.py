@@ -130,6 +130,8 @@ def minimize(
     # prepare result
     if result is None:
         result = Result(problem)
+    # the result must not be modified while it is being saved
+    result.wait_for_save(raise_errors=False)
 
     # engine
     if engine is None:
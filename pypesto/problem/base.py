@@ -297,6 +297,26 @@ class Problem:
         self.x_guesses_full = x_guesses_full
         self._check_x_guesses()
 
+    def _shallow_copy_for_profile(self) -> "Problem":
+        """
+        Create a copy of the problem that is safe to use for profiling.
+
+        Only the state modified during profiling (fixed parameters and the
+        objective, which is kept aware of them) is copied deeply. All other
+        attributes are shared with the original problem.
+        """
+        problem = copy.copy(self)
+        # a shared memo keeps priors contained in the objective consistent
+        memo = {}
+        problem.objective = copy.deepcopy(self.objective, memo)
+        problem.x_priors = copy.deepcopy(self.x_priors, memo)
+        problem.lb_full = self.lb_full.copy()
+        problem.ub_full = self.ub_full.copy()
+        problem.x_fixed_indices = list(self.x_fixed_indices)
+        problem.x_fixed_vals = list(self.x_fixed_vals)
+        problem.x_guesses_full = self.x_guesses_full.copy()
+        return problem
+
     def fix_parameters(
         self,
         parameter_indices: SupportsIntIterableOrValue,
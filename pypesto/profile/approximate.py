@@ -57,6 +57,9 @@ def approximate_parameter_profile(
     if profile_index is None:
         profile_index = problem.x_free_indices
 
+    # the result must not be modified while it is being saved
+    result.wait_for_save(raise_errors=False)
+
     # create the profile result object (retrieve global optimum) or append to
     # existing list of profiles
     global_opt = initialize_profile(
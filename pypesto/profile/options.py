@@ -38,6 +38,22 @@ class ProfileOptions(dict):
     whole_path:
         Whether to profile the whole bounds or only till we get below the
         ratio.
+    async_save:
+        Whether to save the result to file in a background thread, if a
+        filename is passed to :func:`pypesto.profile.parameter_profile`.
+        Functions modifying the result wait for the saving to finish. Use
+        :meth:`pypesto.Result.wait_for_save` to wait for it and to check for
+        errors, before modifying the result otherwise.
+    resume:
+        Whether to skip parameters whose profile in the given
+        ``profile_list`` was already completed by a previous call to
+        :func:`pypesto.profile.parameter_profile`.
+    split_directions:
+        Whether to compute the descending and the ascending part of each
+        profile as separate tasks, which allows for more parallelization.
+        Adaptive next guess methods then do not take the points of the other
+        direction into account, so the profiles may differ from those
+        computed in one task.
     """
 
     def __init__(
@@ -52,6 +68,9 @@ class ProfileOptions(dict):
         reg_order: int = 4,
         magic_factor_obj_value: float = 0.5,
         whole_path: bool = False,
+        async_save: bool = False,
+        resume: bool = False,
+        split_directions: bool = False,
     ):
         super().__init__()
 
@@ -65,6 +84,9 @@ class ProfileOptions(dict):
         self.reg_order = reg_order
         self.magic_factor_obj_value = magic_factor_obj_value
         self.whole_path = whole_path
+        self.async_save = async_save
+        self.resume = resume
+        self.split_directions = split_directions
 
         self.validate()
 
@@ -1,21 +1,54 @@
 import copy
+import functools
 import logging
+import os
 from collections.abc import Iterable
 from typing import Callable, Union
 
-from ..engine import Engine, SingleCoreEngine
+import cloudpickle
+
+from ..C import PYPESTO_PROFILE_DEEPCOPY
+from ..engine import Engine, MultiProcessEngine, SingleCoreEngine
 from ..optimize import Optimizer
 from ..problem import Problem
 from ..result import Result
-from ..store import autosave
+from ..store import AutosaveThread, autosave
 from .options import ProfileOptions
 from .profile_next_guess import next_guess
 from .task import ProfilerTask
-from .util import initialize_profile
+from .util import initialize_profile, merge_profile_directions
 
 logger = logging.getLogger(__name__)
 
 
+def _create_next_guess(
+    x,
+    par_index,
+    par_direction_,
+    profile_options_,
+    current_profile_,
+    problem_,
+    global_opt_,
+    *,
+    next_guess_method,
+):
+    """Create the next guess with a fixed `next_guess_method`.
+
+    Module-level so that it can be bound via :func:`functools.partial`,
+    which is cheap to pickle when sent to other processes.
+    """
+    return next_guess(
+        x,
+        par_index,
+        par_direction_,
+        profile_options_,
+        next_guess_method,
+        current_profile_,
+        problem_,
+        global_opt_,
+    )
+
+
 def parameter_profile(
     problem: Problem,
     result: Result,
@@ -47,6 +80,9 @@ def parameter_profile(
     engine:
         The engine to be used.
         Defaults to :class:`pypesto.engine.SingleCoreEngine`.
+        When profiling repeatedly, passing the same
+        :class:`pypesto.engine.MultiProcessEngine` to all calls reuses its
+        worker processes instead of starting new ones every time.
     profile_index:
         List with the parameter indices to be profiled
         (by default all free indices).
@@ -75,13 +111,18 @@ def parameter_profile(
     overwrite:
         Whether to overwrite `result/profiling` in the autosave file
         if it already exists.
+        See also :attr:`pypesto.profile.ProfileOptions.async_save`.
 
     Returns
     -------
     The profile results are filled into `result.profile_result`.
     """
-    # Copy the problem to avoid side effects
-    problem = copy.deepcopy(problem)
+    # Copy the problem to avoid side effects. Only the parts modified during
+    # profiling are copied, unless a full deep copy is requested.
+    if os.environ.get(PYPESTO_PROFILE_DEEPCOPY, "0") == "1":
+        problem = copy.deepcopy(problem)
+    else:
+        problem = problem._shallow_copy_for_profile()
     # Handling defaults
     # profiling indices
     if profile_index is None:
@@ -95,27 +136,9 @@ def parameter_profile(
 
     # create a function handle that will be called later to get the next point
     if isinstance(next_guess_method, str):
-
-        def create_next_guess(
-            x,
-            par_index,
-            par_direction_,
-            profile_options_,
-            current_profile_,
-            problem_,
-            global_opt_,
-        ):
-            return next_guess(
-                x,
-                par_index,
-                par_direction_,
-                profile_options_,
-                next_guess_method,
-                current_profile_,
-                problem_,
-                global_opt_,
-            )
-
+        create_next_guess = functools.partial(
+            _create_next_guess, next_guess_method=next_guess_method
+        )
     elif callable(next_guess_method):
         raise NotImplementedError(
             "Passing function handles for computation of next "
@@ -124,57 +147,147 @@ def parameter_profile(
     else:
         raise ValueError("Unsupported input for next_guess_method.")
 
+    # the result must not be modified while it is being saved
+    result.wait_for_save(raise_errors=False)
+
     # create the profile result object (retrieve global optimum) or append to
     # existing list of profiles
     global_opt = initialize_profile(
         problem, result, result_index, profile_index, profile_list
     )
-    # if engine==None set SingleCoreEngine() as default
-    if engine is None:
+
+    # only compute profiles for free parameters
+    fixed_indices = frozenset(problem.x_fixed_indices)
+    free_indices = [i for i in profile_index if i not in fixed_indices]
+    skipped_indices = [i for i in profile_index if i in fixed_indices]
+    if skipped_indices:
+        logger.warning(
+            f"Parameters {skipped_indices} are fixed and will not be "
+            "profiled."
+        )
+
+    # skip profiles completed by a previous call
+    if profile_options.resume:
+        completed_indices = [
+            i_par
+            for i_par in free_indices
+            if getattr(
+                result.profile_result.get_profiler_result(
+                    i_par=i_par, profile_list=profile_list
+                ),
+                "done",
+                False,
+            )
+        ]
+        if completed_indices:
+            logger.info(
+                f"Profiles for parameters {completed_indices} are already "
+                "completed and will not be recomputed."
+            )
+            free_indices = [
+                i for i in free_indices if i not in completed_indices
+            ]
+
+    # if engine==None set SingleCoreEngine() as default. Without any
+    #  parameter to profile, skip the engine overhead.
+    if engine is None or not free_indices:
         engine = SingleCoreEngine()
 
-    # create Tasks
+    # tasks executed in separate processes share one serialized problem,
+    #  such that the problem is only pickled once
+    if isinstance(engine, MultiProcessEngine):
+        problem_kwargs = {
+            "problem": None,
+            "pickled_problem": cloudpickle.dumps(problem),
+        }
+    else:
+        problem_kwargs = {"problem": problem}
+
+    # create Tasks. If requested, each profile is computed separately in
+    #  descending and ascending direction, to allow for more parallelization.
+    #  Otherwise, the ascending direction continues from the descending one.
+    split_directions = profile_options.split_directions
     tasks = []
+    n_points_initial = {}
+    get_profiler_result = result.profile_result.get_profiler_result
+    profile_slot = result.profile_result.list[-1]
     # loop over parameters to create tasks
-    for i_par in profile_index:
-        # only compute profiles for free parameters
-        if i_par in problem.x_fixed_indices:
-            # log a warning
-            logger.warning(
-                f"Parameter {i_par} is fixed and will not be profiled."
-            )
-            continue
-
-        current_profile = result.profile_result.get_profiler_result(
+    for i_par in free_indices:
+        current_profile = get_profiler_result(
             i_par=i_par,
             profile_list=profile_list,
         )
 
-        task = ProfilerTask(
-            current_profile=current_profile,
-            problem=problem,
-            optimizer=optimizer,
-            options=profile_options,
-            create_next_guess=create_next_guess,
-            global_opt=global_opt,
-            i_par=i_par,
-        )
-        tasks.append(task)
+        if split_directions:
+            n_points_initial[i_par] = current_profile.x_path.shape[1]
+
+            # the ascending half only accounts for its own effort
+            ascending_profile = copy.deepcopy(current_profile)
+            ascending_profile.time_total = 0.0
+            ascending_profile.n_fval = 0
+            ascending_profile.n_grad = 0
+            ascending_profile.n_hess = 0
+
+            directed_profiles = ((-1, current_profile), (1, ascending_profile))
+        else:
+            directed_profiles = ((None, current_profile),)
+
+        for par_direction, profile_ in directed_profiles:
+            task = ProfilerTask(
+                current_profile=profile_,
+                optimizer=optimizer,
+                options=profile_options,
+                create_next_guess=create_next_guess,
+                global_opt=global_opt,
+                i_par=i_par,
+                par_direction=par_direction,
+                **problem_kwargs,
+            )
+            tasks.append(task)
 
     # execute the tasks with Engine
     indexed_profiles = engine.execute(tasks, progress_bar=progress_bar)
 
-    # fill in the ProfilerResults at the right index
-    for indexed_profile in indexed_profiles:
-        result.profile_result.list[-1][
-            indexed_profile["index"]
-        ] = indexed_profile["profile"]
-
-    autosave(
-        filename=filename,
-        result=result,
-        store_type="profile",
-        overwrite=overwrite,
-    )
+    # merge both directions, if computed separately, and fill in the
+    #  ProfilerResults at the right index
+    descending_profiles = {
+        indexed_profile.index: indexed_profile.profile
+        for indexed_profile in indexed_profiles
+        if indexed_profile.direction == -1
+    }
+    for indexed_profile in sorted(
+        (
+            indexed_profile
+            for indexed_profile in indexed_profiles
+            if indexed_profile.direction != -1
+        ),
+        key=lambda indexed_profile: indexed_profile.index,
+    ):
+        i_par = indexed_profile.index
+        if indexed_profile.direction is None:
+            profile_slot[i_par] = indexed_profile.profile
+        else:
+            profile_slot[i_par] = merge_profile_directions(
+                descending=descending_profiles[i_par],
+                ascending=indexed_profile.profile,
+                n_points_initial=n_points_initial[i_par],
+            )
+        profile_slot[i_par].done = True
+
+    if filename is not None and profile_options.async_save:
+        result._pending_save = AutosaveThread(
+            filename=filename,
+            result=result,
+            store_type="profile",
+            overwrite=overwrite,
+        )
+        result._pending_save.start()
+    elif filename is not None:
+        autosave(
+            filename=filename,
+            result=result,
+            store_type="profile",
+            overwrite=overwrite,
+        )
 
     return result
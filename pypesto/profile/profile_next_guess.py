@@ -9,6 +9,17 @@ from .options import ProfileOptions
 __all__ = ["next_guess", "fixed_step", "adaptive_step"]
 
 
+def _extrapolate_linearly(
+    x: np.ndarray,
+    delta_x_dir: np.ndarray,
+    step_length: float,
+    lb: np.ndarray,
+    ub: np.ndarray,
+) -> np.ndarray:
+    """Step along `delta_x_dir` and clip the result to the bounds."""
+    return np.clip(x + step_length * delta_x_dir, lb, ub)
+
+
 def next_guess(
     x: np.ndarray,
     par_index: int,
@@ -246,8 +257,9 @@ def adaptive_step(
     else:
         # if not, we do simple extrapolation
         def par_extrapol(step_length):
-            x_step = x + step_length * delta_x_dir
-            return clip_to_bounds(x_step)
+            return _extrapolate_linearly(
+                x, delta_x_dir, step_length, problem.lb_full, problem.ub_full
+            )
 
     # compute proposal
     next_x = par_extrapol(step_size_guess)
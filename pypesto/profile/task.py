@@ -1,5 +1,7 @@
 import logging
-from typing import Any, Callable
+from typing import Callable, Literal, NamedTuple, Optional
+
+import cloudpickle
 
 import pypesto.optimize
 
@@ -12,18 +14,39 @@ from .walk_along_profile import walk_along_profile
 logger = logging.getLogger(__name__)
 
 
+class IndexedProfile(NamedTuple):
+    """A computed profile together with the index of the profiled parameter.
+
+    Attributes
+    ----------
+    index:
+        Index of the profiled parameter.
+    profile:
+        The computed profile.
+    direction:
+        The direction in which the profile was computed (``1`` or ``-1``),
+        or ``None`` if it was computed in both directions.
+    """
+
+    index: int
+    profile: ProfilerResult
+    direction: Optional[Literal[1, -1]] = None
+
+
 class ProfilerTask(Task):
     """A parameter likelihood profiling task."""
 
     def __init__(
         self,
         current_profile: ProfilerResult,
-        problem: Problem,
+        problem: Optional[Problem],
         options: ProfileOptions,
         i_par: int,
         global_opt: float,
         optimizer: "pypesto.optimize.Optimizer",
         create_next_guess: Callable,
+        pickled_problem: bytes = None,
+        par_direction: Optional[Literal[1, -1]] = None,
     ):
         """
         Create the task object.
@@ -33,7 +56,8 @@ class ProfilerTask(Task):
         current_profile:
             The profile which should be computed
         problem:
-            The problem to be solved.
+            The problem to be solved. Alternatively, ``pickled_problem`` can
+            be provided.
         optimizer:
             The optimizer to be used along each profile.
         global_opt:
@@ -44,24 +68,50 @@ class ProfilerTask(Task):
             Handle of the method which creates the next profile point proposal
         i_par:
             index for the current parameter
+        pickled_problem:
+            The problem to be solved, serialized by :mod:`cloudpickle`.
+            Avoids serializing the problem once per task when tasks are
+            executed in separate processes. Each task deserializes its own
+            copy of the problem.
+        par_direction:
+            The direction in which to compute the profile (``1`` or ``-1``).
+            By default, the profile is computed in both directions.
+            A profile computed in descending direction is returned flipped.
         """
         super().__init__()
 
+        if (problem is None) == (pickled_problem is None):
+            raise ValueError(
+                "Exactly one of `problem` and `pickled_problem` must be "
+                "provided."
+            )
+
         self.optimizer = optimizer
         self.problem = problem
+        self.pickled_problem = pickled_problem
         self.current_profile = current_profile
         self.global_opt = global_opt
         self.create_next_guess = create_next_guess
         self.i_par = i_par
         self.options = options
+        self.par_direction = par_direction
 
-    def execute(self) -> dict[str, Any]:
-        """Compute profile in descending and ascending direction."""
+    def execute(self) -> IndexedProfile:
+        """Compute profile in descending and/or ascending direction."""
         logger.debug(f"Executing task {self.i_par}.")
 
-        for par_direction in [-1, 1]:
-            # flip profile
-            self.current_profile.flip_profile()
+        if self.problem is None:
+            self.problem = cloudpickle.loads(self.pickled_problem)
+
+        if self.par_direction is None:
+            par_directions = [-1, 1]
+        else:
+            par_directions = [self.par_direction]
+
+        for par_direction in par_directions:
+            # flip profile, unless only the ascending direction is computed
+            if par_direction == -1 or self.par_direction is None:
+                self.current_profile.flip_profile()
 
             # compute the current profile
             self.current_profile = walk_along_profile(
@@ -76,4 +126,8 @@ class ProfilerTask(Task):
             )
 
         # return the ProfilerResult and the index of the parameter profiled
-        return {"profile": self.current_profile, "index": self.i_par}
+        return IndexedProfile(
+            index=self.i_par,
+            profile=self.current_profile,
+            direction=self.par_direction,
+        )
@@ -1,5 +1,6 @@
 """Utility function for profile module."""
 
+import functools
 from collections.abc import Iterable
 from typing import Any
 
@@ -11,6 +12,7 @@ from ..problem import Problem
 from ..result import ProfileResult, ProfilerResult, Result
 
 
+@functools.lru_cache(maxsize=None)
 def chi2_quantile_to_ratio(alpha: float = 0.95, df: int = 1):
     """
     Compute profile likelihood threshold.
@@ -66,20 +68,83 @@ def calculate_approximate_ci(
         lb = xs[l_ind]
     else:
         # linear interpolation with next smaller value
-        ind = [l_ind - 1, l_ind]
-        lb = np.interp(confidence_ratio, ratios[ind], xs[ind])
+        lb = _interpolate_linearly(
+            confidence_ratio,
+            ratios[l_ind - 1],
+            ratios[l_ind],
+            xs[l_ind - 1],
+            xs[l_ind],
+        )
 
     # upper bound
     if u_ind == len(ratios) - 1:
         ub = xs[u_ind]
     else:
         # linear interpolation with next larger value
-        ind = [u_ind + 1, u_ind]  # flipped as interp expects increasing xs
-        ub = np.interp(confidence_ratio, ratios[ind], xs[ind])
+        ub = _interpolate_linearly(
+            confidence_ratio,
+            ratios[u_ind + 1],
+            ratios[u_ind],
+            xs[u_ind + 1],
+            xs[u_ind],
+        )
 
     return lb, ub
 
 
+def _interpolate_linearly(
+    ratio: float, ratio0: float, ratio1: float, x0: float, x1: float
+) -> float:
+    """Interpolate x at `ratio` between two points, like :func:`numpy.interp`.
+
+    Avoids creating arrays for just two points.
+    """
+    slope = (x1 - x0) / (ratio1 - ratio0)
+    return slope * (ratio - ratio0) + x0
+
+
+def merge_profile_directions(
+    descending: ProfilerResult,
+    ascending: ProfilerResult,
+    n_points_initial: int,
+) -> ProfilerResult:
+    """
+    Merge profiles computed separately in both directions.
+
+    Both profiles extend the same initial profile. The descending profile is
+    expected in flipped order, as returned by
+    :class:`pypesto.profile.task.ProfilerTask`. Counters and total time of
+    the ascending profile must only cover its new points.
+
+    Parameters
+    ----------
+    descending:
+        The profile computed in descending direction. Modified in-place.
+    ascending:
+        The profile computed in ascending direction.
+    n_points_initial:
+        Number of points of the initial profile.
+
+    Returns
+    -------
+    The merged profile, in ascending order.
+    """
+    descending.flip_profile()
+    for i_point in range(n_points_initial, ascending.x_path.shape[1]):
+        descending.append_profile_point(
+            x=ascending.x_path[:, i_point],
+            fval=ascending.fval_path[i_point],
+            ratio=ascending.ratio_path[i_point],
+            gradnorm=ascending.gradnorm_path[i_point],
+            time=ascending.time_path[i_point],
+            exitflag=ascending.exitflag_path[i_point],
+        )
+    descending.n_fval += ascending.n_fval
+    descending.n_grad += ascending.n_grad
+    descending.n_hess += ascending.n_hess
+    return descending
+
+
 def initialize_profile(
     problem: Problem,
     result: Result,
@@ -4,6 +4,16 @@ import copy
 
 import numpy as np
 
+# profile paths, with the profile points along the last axis
+PATH_KEYS = (
+    "x_path",
+    "fval_path",
+    "ratio_path",
+    "gradnorm_path",
+    "exitflag_path",
+    "time_path",
+)
+
 
 class ProfilerResult(dict):
     """
@@ -40,11 +50,16 @@ class ProfilerResult(dict):
         Number of Hessian evaluations.
     message:
         Textual comment on the profile result.
+    done:
+        Whether the profile computation was completed.
 
     Notes
     -----
     Any field not supported by the profiler or the profiling optimizer is
     filled with None. Some fields are filled by pypesto itself.
+
+    The paths are views into buffers that grow by doubling their capacity,
+    such that appending profile points is amortized constant time.
     """
 
     def __init__(
@@ -60,6 +75,7 @@ class ProfilerResult(dict):
         n_grad: int = 0,
         n_hess: int = 0,
         message: str = None,
+        done: bool = False,
     ):
         super().__init__()
 
@@ -104,6 +120,7 @@ class ProfilerResult(dict):
         self.n_grad = n_grad
         self.n_hess = n_hess
         self.message = message
+        self.done = done
 
     def __getattr__(self, key):
         """Allow usage of keys like attributes."""
@@ -115,6 +132,10 @@ class ProfilerResult(dict):
     __setattr__ = dict.__setitem__
     __delattr__ = dict.__delitem__
 
+    def __getstate__(self):
+        # only the paths are stored, not the buffers backing them
+        return {}
+
     def append_profile_point(
         self,
         x: np.ndarray,
@@ -153,12 +174,28 @@ class ProfilerResult(dict):
         n_hess:
             Number of Hessian evaluations performed to find `x`.
         """
-        self.x_path = np.hstack((self.x_path, x[..., np.newaxis]))
-        self.fval_path = np.hstack((self.fval_path, fval))
-        self.ratio_path = np.hstack((self.ratio_path, ratio))
-        self.gradnorm_path = np.hstack((self.gradnorm_path, gradnorm))
-        self.exitflag_path = np.hstack((self.exitflag_path, exitflag))
-        self.time_path = np.hstack((self.time_path, time))
+        values = {
+            "x_path": x,
+            "fval_path": fval,
+            "ratio_path": ratio,
+            "gradnorm_path": gradnorm,
+            "exitflag_path": exitflag,
+            "time_path": time,
+        }
+        buffers = self._get_path_buffers()
+        n_points = self.x_path.shape[-1]
+        for key, value in values.items():
+            buffer = buffers[key]
+            dtype = np.result_type(buffer, value)
+            if n_points == buffer.shape[-1] or dtype != buffer.dtype:
+                # grow the buffer
+                new_buffer = np.empty(
+                    buffer.shape[:-1] + (max(2 * n_points, 1),), dtype=dtype
+                )
+                new_buffer[..., :n_points] = buffer[..., :n_points]
+                buffers[key] = buffer = new_buffer
+            buffer[..., n_points] = value
+            self._set_path_view(key, buffer[..., : n_points + 1])
 
         # increment the time and f_eval counters
         self.time_total += time
@@ -171,15 +208,55 @@ class ProfilerResult(dict):
         Flip the profiling direction (left-right).
 
         Profiling direction needs to be changed once (if the profile is new),
-        or twice if we append to an existing profile. All profiling paths
-        are flipped in-place.
+        or twice if we append to an existing profile. The flipped paths are
+        new arrays, as the current ones may be shared with copies.
+        """
+        buffers = self._get_path_buffers()
+        n_points = self.x_path.shape[-1]
+        for key in PATH_KEYS:
+            buffer = np.empty_like(buffers[key])
+            buffer[..., :n_points] = np.flip(
+                buffers[key][..., :n_points], axis=-1
+            )
+            buffers[key] = buffer
+            self._set_path_view(key, buffer[..., :n_points])
+
+    def _get_path_buffers(self) -> dict[str, np.ndarray]:
+        """
+        Get the buffers backing the profile paths.
+
+        The buffers are (re-)created from the current paths if those are not
+        views into the buffers, e.g. after construction, copying, or if a
+        path was assigned directly.
         """
-        self.x_path = np.fliplr(self.x_path)
-        self.fval_path = np.flip(self.fval_path)
-        self.ratio_path = np.flip(self.ratio_path)
-        self.gradnorm_path = np.flip(self.gradnorm_path)
-        self.exitflag_path = np.flip(self.exitflag_path)
-        self.time_path = np.flip(self.time_path)
+        buffers = self.__dict__.get("_buffers")
+        views = self.__dict__.get("_views", {})
+        if buffers is not None and all(
+            self[key] is views.get(key) and self[key].base is buffers[key]
+            for key in PATH_KEYS
+        ):
+            return buffers
+
+        buffers = {}
+        for key in PATH_KEYS:
+            path = np.asarray(self[key])
+            n_points = path.shape[-1]
+            buffer = np.empty(
+                path.shape[:-1] + (max(2 * n_points, 1),), dtype=path.dtype
+            )
+            buffer[..., :n_points] = path
+            buffers[key] = buffer
+        # stored outside the dict, to not be mistaken for a result field
+        self.__dict__["_buffers"] = buffers
+        self.__dict__["_views"] = {}
+        for key in PATH_KEYS:
+            self._set_path_view(key, buffers[key][..., : self[key].shape[-1]])
+        return buffers
+
+    def _set_path_view(self, key: str, view: np.ndarray) -> None:
+        """Set a profile path to a view into its buffer."""
+        self[key] = view
+        self.__dict__["_views"][key] = view
 
 
 class ProfileResult:
@@ -35,6 +35,32 @@ class Result:
         self.optimize_result = optimize_result or OptimizeResult()
         self.profile_result = profile_result or ProfileResult()
         self.sample_result = sample_result or SampleResult()
+        # background thread currently saving this result, if any
+        self._pending_save = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # threads cannot be pickled
+        state["_pending_save"] = None
+        return state
+
+    def wait_for_save(self, raise_errors: bool = True) -> None:
+        """
+        Wait for a pending background save of this result to finish.
+
+        Parameters
+        ----------
+        raise_errors:
+            Whether to re-raise errors raised while saving. Such errors are
+            logged when they occur in any case. Functions modifying the result
+            wait without re-raising, to not fail because of an earlier,
+            unrelated save.
+        """
+        pending_save = getattr(self, "_pending_save", None)
+        if pending_save is None:
+            return
+        self._pending_save = None
+        pending_save.join(raise_errors=raise_errors)
 
     def summary(self, full: bool = False, show_hess: bool = True) -> str:
         """
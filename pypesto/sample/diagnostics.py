@@ -43,7 +43,8 @@ def geweke_test(
         # Log
         logger.info(f"Geweke burn-in index: {burn_in}")
 
-        # Fill in burn-in value into result
+        # Fill in burn-in value into result, once it is not being saved
+        result.wait_for_save(raise_errors=False)
         result.sample_result.burn_in = burn_in
 
     return burn_in
@@ -96,7 +97,8 @@ def auto_correlation(result: Result) -> float:
     # Log
     logger.info(f"Estimated chain autocorrelation: {_auto_correlation}")
 
-    # Fill in autocorrelation value into result
+    # Fill in autocorrelation value into result, once it is not being saved
+    result.wait_for_save(raise_errors=False)
     result.sample_result.auto_correlation = _auto_correlation
 
     return _auto_correlation
@@ -143,7 +145,9 @@ def effective_sample_size(result: Result) -> float:
     # Log
     logger.info(f"Estimated effective sample size: {ess}")
 
-    # Fill in effective sample size value into result
+    # Fill in effective sample size value into result, once it is not being
+    #  saved
+    result.wait_for_save(raise_errors=False)
     result.sample_result.effective_sample_size = ess
 
     return ess
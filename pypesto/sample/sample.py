@@ -62,6 +62,8 @@ def sample(
     # prepare result object
     if result is None:
         result = Result(problem)
+    # the result must not be modified while it is being saved
+    result.wait_for_save(raise_errors=False)
 
     # number of samples
     if n_samples is not None:
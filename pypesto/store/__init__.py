@@ -5,7 +5,7 @@ Storage
 Saving and loading traces and results objects.
 """
 
-from .auto import autosave
+from .auto import AutosaveThread, autosave
 from .hdf5 import write_array
 from .read_from_hdf5 import (
     OptimizationResultHDF5Reader,
@@ -4,6 +4,8 @@ import binascii
 import datetime
 import logging
 import os
+import threading
+import weakref
 from pathlib import Path
 from typing import Callable, Union
 
@@ -14,6 +16,11 @@ from .save_to_hdf5 import write_result
 
 logger = logging.getLogger(__name__)
 
+# locks serializing background writes to the same file. Locks are dropped
+#  once no thread uses them anymore.
+_autosave_locks = weakref.WeakValueDictionary()
+_autosave_locks_lock = threading.Lock()
+
 
 def autosave(
     filename: Union[Path, str, Callable, None],
@@ -73,6 +80,77 @@ def autosave(
     )
 
 
+class AutosaveThread(threading.Thread):
+    """
+    Run :func:`autosave` in a background thread.
+
+    Background writes to the same file are serialized. Exceptions raised
+    while saving are logged and re-raised by :meth:`join`. The result must
+    not be modified before the thread has finished.
+
+    Parameters
+    ----------
+    filename, result, store_type, overwrite:
+        See :func:`autosave`.
+    """
+
+    def __init__(
+        self,
+        filename: Union[Path, str, Callable, None],
+        result: Result,
+        store_type: str,
+        overwrite: bool = False,
+    ):
+        # not a daemon thread, to not leave a partially written file behind
+        #  at interpreter exit
+        super().__init__(name=f"pypesto-autosave-{store_type}")
+        self.filename = filename
+        self.result = result
+        self.store_type = store_type
+        self.overwrite = overwrite
+        self.exception = None
+
+    def run(self) -> None:
+        """Save the result, holding the lock for the target file."""
+        if isinstance(self.filename, (str, Path)):
+            key = str(self.filename)
+        else:
+            key = self.filename
+        with _autosave_locks_lock:
+            lock = _autosave_locks.setdefault(key, threading.Lock())
+        try:
+            with lock:
+                autosave(
+                    filename=self.filename,
+                    result=self.result,
+                    store_type=self.store_type,
+                    overwrite=self.overwrite,
+                )
+        except Exception as e:
+            # log here as well, in case the thread is never joined
+            logger.exception(
+                f"Saving the {self.store_type} result to {self.filename} in "
+                "the background failed."
+            )
+            self.exception = e
+
+    def join(self, timeout: float = None, raise_errors: bool = True) -> None:
+        """Wait for the thread to finish and re-raise saving errors.
+
+        Parameters
+        ----------
+        timeout:
+            See :meth:`threading.Thread.join`.
+        raise_errors:
+            Whether to re-raise errors raised while saving. They are logged
+            in any case.
+        """
+        super().join(timeout=timeout)
+        if raise_errors and self.exception is not None:
+            exception, self.exception = self.exception, None
+            raise exception
+
+
 def default_filename(**kwargs) -> str:
     """Create a filename when results will be autosaved.
 
@@ -733,6 +733,7 @@ def sampling_prediction_trajectories(
     average: str = MEDIAN,
     add_sd: bool = False,
     measurement_df: pd.DataFrame = None,
+    summary: dict[str, PredictionResult] = None,
 ) -> matplotlib.axes.Axes:
     """
     Visualize prediction trajectory of an EnsemblePrediction.
@@ -783,6 +784,13 @@ def sampling_prediction_trajectories(
         Plot measurement data. NB: This should take the form of a PEtab
         measurements table, and the `observableId` column should correspond
         to the output IDs in the ensemble prediction.
+    summary:
+        A summary of the ensemble prediction, as computed by
+        :meth:`pypesto.ensemble.EnsemblePrediction.compute_summary`. It
+        must contain the percentiles required for `levels`. Providing it
+        avoids recomputing the summary when plotting the same ensemble
+        prediction repeatedly. Computed from `ensemble_prediction` with
+        the given `weighting` by default.
 
     Returns
     -------
@@ -801,9 +809,22 @@ def sampling_prediction_trajectories(
         for percentile in _get_level_percentiles(level)
     ]
 
-    summary = ensemble_prediction.compute_summary(
-        percentiles_list=percentiles, weighting=weighting
-    )
+    if summary is None:
+        summary = ensemble_prediction.compute_summary(
+            percentiles_list=percentiles, weighting=weighting
+        )
+    else:
+        missing_percentiles = [
+            percentile
+            for percentile in percentiles
+            if get_percentile_label(percentile) not in summary
+        ]
+        if missing_percentiles:
+            raise ValueError(
+                "The provided `summary` lacks the percentiles "
+                f"{missing_percentiles}, which are required for the "
+                "requested `levels`."
+            )
 
     all_condition_ids, all_output_ids = _get_condition_and_output_ids(summary)
     if condition_ids is None:
@@ -1,5 +1,6 @@
 """Test objective aggregation."""
 
+import functools
 import itertools as itt
 
 import numpy as np
@@ -17,8 +18,14 @@ ATOL = 1e-6
 RTOL = 1e-4
 
 
+@functools.lru_cache(maxsize=1)
+def _convreact_objective():
+    """Load the conversion reaction objective once per test session."""
+    return load_amici_objective("conversion_reaction")[0]
+
+
 def convreact_for_funmode(max_sensi_order, x=None):
-    obj = load_amici_objective("conversion_reaction")[0]
+    obj = _convreact_objective()
     return {
         "obj": obj,
         "max_sensi_order": max_sensi_order,
@@ -30,7 +37,7 @@ def convreact_for_funmode(max_sensi_order, x=None):
 
 
 def convreact_for_resmode(max_sensi_order, x=None):
-    obj = load_amici_objective("conversion_reaction")[0]
+    obj = _convreact_objective()
     return {
         "obj": obj,
         "max_sensi_order": max_sensi_order,
@@ -82,12 +89,12 @@ def _test_evaluate_funmode(struct):
     if max_sensi_order >= 2:
         fval, grad, hess = obj(x, (0, 1, 2))
         assert np.isclose(fval, fval_true, atol=ATOL, rtol=RTOL)
-        assert np.isclose(grad, grad_true, atol=ATOL, rtol=RTOL).all()
-        assert np.isclose(hess, hess_true, atol=ATOL, rtol=RTOL).all()
+        assert np.allclose(grad, grad_true, atol=ATOL, rtol=RTOL)
+        assert np.allclose(hess, hess_true, atol=ATOL, rtol=RTOL)
     elif max_sensi_order >= 1:
         fval, grad = obj(x, (0, 1))
         assert np.isclose(fval, fval_true, atol=ATOL, rtol=RTOL)
-        assert np.isclose(grad, grad_true, atol=ATOL, rtol=RTOL).all()
+        assert np.allclose(grad, grad_true, atol=ATOL, rtol=RTOL)
 
     # check default argument
     assert np.isclose(obj(x), fval_true, atol=ATOL, rtol=RTOL)
@@ -95,50 +102,44 @@ def _test_evaluate_funmode(struct):
     # check convenience functions
     assert np.isclose(obj.get_fval(x), fval_true, atol=ATOL, rtol=RTOL)
     if max_sensi_order >= 1:
-        assert np.isclose(
-            obj.get_grad(x), grad_true, atol=ATOL, rtol=RTOL
-        ).all()
+        assert np.allclose(obj.get_grad(x), grad_true, atol=ATOL, rtol=RTOL)
     if max_sensi_order >= 2:
-        assert np.isclose(
-            obj.get_hess(x), hess_true, atol=ATOL, rtol=RTOL
-        ).all()
+        assert np.allclose(obj.get_hess(x), hess_true, atol=ATOL, rtol=RTOL)
 
     # check different calling types
     if max_sensi_order >= 1:
         grad = obj(x, (1,))
-        assert np.isclose(grad, grad_true).all()
+        assert np.allclose(grad, grad_true)
 
     if max_sensi_order >= 2:
         grad, hess = obj(x, (1, 2))
-        assert np.isclose(grad, grad_true, atol=ATOL, rtol=RTOL).all()
-        assert np.isclose(hess, hess_true, atol=ATOL, rtol=RTOL).all()
+        assert np.allclose(grad, grad_true, atol=ATOL, rtol=RTOL)
+        assert np.allclose(hess, hess_true, atol=ATOL, rtol=RTOL)
 
         hess = obj(x, (2,))
-        assert np.isclose(hess, hess_true, atol=ATOL, rtol=RTOL).all()
+        assert np.allclose(hess, hess_true, atol=ATOL, rtol=RTOL)
 
 
 def _test_evaluate_resmode(struct):
     obj = pypesto.objective.AggregatedObjective([struct["obj"], struct["obj"]])
     x = struct["x"]
-    res_true = np.hstack([struct["res"], struct["res"]])
-    sres_true = np.vstack([struct["sres"], struct["sres"]])
+    res_true = np.tile(struct["res"], 2)
+    sres_true = np.tile(struct["sres"], (2, 1))
     max_sensi_order = struct["max_sensi_order"]
 
     # check function values
     if max_sensi_order >= 1:
         res, sres = obj(x, (0, 1), MODE_RES)
-        assert np.isclose(res, res_true, atol=ATOL, rtol=RTOL).all()
-        assert np.isclose(sres, sres_true, atol=ATOL, rtol=RTOL).all()
+        assert np.allclose(res, res_true, atol=ATOL, rtol=RTOL)
+        assert np.allclose(sres, sres_true, atol=ATOL, rtol=RTOL)
 
     res = obj(x, (0,), MODE_RES)
-    assert np.isclose(res, res_true, atol=ATOL, rtol=RTOL).all()
+    assert np.allclose(res, res_true, atol=ATOL, rtol=RTOL)
 
     # check convenience functions)
-    assert np.isclose(obj.get_res(x), res_true, atol=ATOL, rtol=RTOL).all()
+    assert np.allclose(obj.get_res(x), res_true, atol=ATOL, rtol=RTOL)
     if max_sensi_order >= 1:
-        assert np.isclose(
-            obj.get_sres(x), sres_true, atol=ATOL, rtol=RTOL
-        ).all()
+        assert np.allclose(obj.get_sres(x), sres_true, atol=ATOL, rtol=RTOL)
 
 
 def test_exceptions():
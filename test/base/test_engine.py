@@ -1,6 +1,7 @@
 """Test the execution engines."""
 
 import copy
+import functools
 import os
 
 import amici
@@ -15,6 +16,18 @@ import pypesto.petab
 from ..util import rosen_for_sensi
 
 
+@functools.lru_cache(maxsize=1)
+def _boehm_importer() -> pypesto.petab.PetabImporter:
+    """Load the Boehm PEtab problem once per test session."""
+    return pypesto.petab.PetabImporter.from_yaml(
+        os.path.join(
+            models.MODELS_DIR,
+            "Boehm_JProteomeRes2014",
+            "Boehm_JProteomeRes2014.yaml",
+        )
+    )
+
+
 def test_basic():
     for engine in [
         pypesto.engine.SingleCoreEngine(),
@@ -44,6 +57,25 @@ def _test_basic(engine):
     assert len(result.optimize_result) == 2
 
 
+def test_multi_process_engine_reuses_pool():
+    """Test that the process pool is kept across calls until closed."""
+    engine = pypesto.engine.MultiProcessEngine(n_procs=2)
+    _test_basic(engine)
+    pool = engine._pool
+    assert pool is not None
+    _test_basic(engine)
+    assert engine._pool is pool
+
+    # the engine remains picklable
+    assert pickle.loads(pickle.dumps(engine))._pool is None
+
+    engine.close()
+    assert engine._pool is None
+    _test_basic(engine)
+    assert engine._pool is not None
+    engine.close()
+
+
 def test_petab():
     for engine in [
         pypesto.engine.SingleCoreEngine(),
@@ -57,13 +89,7 @@ def test_petab():
 
 
 def _test_petab(engine):
-    petab_importer = pypesto.petab.PetabImporter.from_yaml(
-        os.path.join(
-            models.MODELS_DIR,
-            "Boehm_JProteomeRes2014",
-            "Boehm_JProteomeRes2014.yaml",
-        )
-    )
+    petab_importer = _boehm_importer()
     objective = petab_importer.create_objective()
     problem = petab_importer.create_problem(objective)
     optimizer = pypesto.optimize.ScipyOptimizer(options={"maxiter": 10})
@@ -79,13 +105,7 @@ def _test_petab(engine):
 
 def test_deepcopy_objective():
     """Test copying objectives (needed for MultiProcessEngine)."""
-    petab_importer = pypesto.petab.PetabImporter.from_yaml(
-        os.path.join(
-            models.MODELS_DIR,
-            "Boehm_JProteomeRes2014",
-            "Boehm_JProteomeRes2014.yaml",
-        )
-    )
+    petab_importer = _boehm_importer()
     objective = petab_importer.create_objective()
 
     objective.amici_solver.setSensitivityMethod(
@@ -116,13 +136,7 @@ def test_deepcopy_objective():
 
 def test_pickle_objective():
     """Test serializing objectives (needed for MultiThreadEngine)."""
-    petab_importer = pypesto.petab.PetabImporter.from_yaml(
-        os.path.join(
-            models.MODELS_DIR,
-            "Boehm_JProteomeRes2014",
-            "Boehm_JProteomeRes2014.yaml",
-        )
-    )
+    petab_importer = _boehm_importer()
     objective = petab_importer.create_objective()
 
     objective.amici_solver.setSensitivityMethod(
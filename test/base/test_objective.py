@@ -52,12 +52,12 @@ def _test_evaluate(struct):
     if max_sensi_order >= 2:
         fval, grad, hess = obj(x, (0, 1, 2))
         assert np.isclose(fval, fval_true)
-        assert np.isclose(grad, grad_true).all()
-        assert np.isclose(hess, hess_true).all()
+        assert np.allclose(grad, grad_true)
+        assert np.allclose(hess, hess_true)
     elif max_sensi_order >= 1:
         fval, grad = obj(x, (0, 1))
         assert np.isclose(fval, fval_true)
-        assert np.isclose(grad, grad_true).all()
+        assert np.allclose(grad, grad_true)
         obj(x, (0, 1, 2))
 
     # check default argument
@@ -66,15 +66,15 @@ def _test_evaluate(struct):
     # check convenience functions
     assert np.isclose(obj.get_fval(x), fval_true)
     if max_sensi_order >= 1:
-        assert np.isclose(obj.get_grad(x), grad_true).all()
+        assert np.allclose(obj.get_grad(x), grad_true)
     if max_sensi_order >= 2:
-        assert np.isclose(obj.get_hess(x), hess_true).all()
+        assert np.allclose(obj.get_hess(x), hess_true)
 
     # check different calling types
     if max_sensi_order >= 2:
         grad, hess = obj(x, (1, 2))
-        assert np.isclose(grad, grad_true).all()
-        assert np.isclose(hess, hess_true).all()
+        assert np.allclose(grad, grad_true)
+        assert np.allclose(hess, hess_true)
 
 
 def test_return_type(integrated, max_sensi_order):
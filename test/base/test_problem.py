@@ -70,6 +70,19 @@ def test_fix_parameters(problem):
         problem.fix_parameters(1, "2")
 
 
+def test_shallow_copy_for_profile(problem):
+    """Test that fixing parameters on the copy leaves the original intact."""
+    problem_copy = problem._shallow_copy_for_profile()
+    assert problem_copy.objective is not problem.objective
+
+    problem_copy.fix_parameters(2, 45)
+    assert problem_copy.x_fixed_indices == [0, 1, 5, 2]
+    assert problem.x_fixed_indices == [0, 1, 5]
+    assert problem.x_fixed_vals == [42, 43, 44]
+    processor = problem.objective.pre_post_processor
+    assert list(processor.x_fixed_indices) == [0, 1, 5]
+
+
 def test_full_index_to_free_index(problem):
     """Test problem.full_index_to_free_index."""
     assert problem.full_index_to_free_index(2) == 0
@@ -31,6 +31,7 @@ from pypesto.C import (
 )
 from pypesto.optimize import optimization_result_from_history
 from pypesto.store import (
+    AutosaveThread,
     OptimizationResultHDF5Reader,
     OptimizationResultHDF5Writer,
     ProblemHDF5Reader,
@@ -254,6 +255,68 @@ def test_storage_profiling():
             os.remove(fn)
 
 
+def test_storage_profiling_async():
+    """Test saving profiles from a background thread."""
+    objective = pypesto.Objective(fun=so.rosen, grad=so.rosen_der)
+    problem = pypesto.Problem(
+        objective=objective, lb=-5 * np.ones(3), ub=5 * np.ones(3)
+    )
+    optimizer = optimize.ScipyOptimizer()
+    result = optimize.minimize(
+        problem=problem, optimizer=optimizer, n_starts=2, progress_bar=False
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fn = os.path.join(tmpdir, "profile.hdf5")
+        result = profile.parameter_profile(
+            problem=problem,
+            result=result,
+            profile_index=[0],
+            optimizer=optimizer,
+            profile_options=profile.ProfileOptions(async_save=True),
+            filename=fn,
+            progress_bar=False,
+        )
+        result.wait_for_save()
+
+        profile_read = ProfileResultHDF5Reader(fn).read()
+        np.testing.assert_array_equal(
+            result.profile_result.list[0][0].x_path,
+            profile_read.profile_result.list[0][0].x_path,
+        )
+
+
+def test_autosave_thread_failure(caplog):
+    """Test that failed background saves are logged and re-raised."""
+
+    def failing_filename(**kwargs):
+        raise OSError("disk full")
+
+    thread = AutosaveThread(
+        filename=failing_filename,
+        result=pypesto.Result(),
+        store_type="profile",
+    )
+    thread.start()
+    with pytest.raises(OSError, match="disk full"):
+        thread.join()
+    assert any(
+        "in the background failed" in record.message
+        for record in caplog.records
+    )
+
+    # functions modifying the result wait without re-raising
+    result = pypesto.Result()
+    result._pending_save = AutosaveThread(
+        filename=failing_filename,
+        result=result,
+        store_type="profile",
+    )
+    result._pending_save.start()
+    result.wait_for_save(raise_errors=False)
+    assert result._pending_save is None
+
+
 def test_storage_sampling():
     """
     This test tests the saving and loading of samples
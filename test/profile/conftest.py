@@ -0,0 +1,95 @@
+import warnings
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+import pypesto
+import pypesto.optimize as optimize
+import pypesto.profile as profile
+
+from ..util import create_optimization_results, rosen_for_sensi
+
+
+@pytest.fixture(scope="session")
+def rosen_first_order_objective():
+    """Rosenbrock objective providing function values and gradients.
+
+    Problems copy their objective, so the objective can be shared.
+    """
+    return rosen_for_sensi(max_sensi_order=1)["obj"]
+
+
+@pytest.fixture(scope="session")
+def rosen_optimization_results():
+    """Optimization results for the 2-dimensional Rosenbrock function.
+
+    Returns the problem, the result and the optimizer. Tests modifying the
+    problem or the result need to work on copies.
+    """
+    objective = rosen_for_sensi(max_sensi_order=2, integrated=True)["obj"]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        # test_selected_profiling starts profiling from the third optimum
+        return create_optimization_results(objective, n_starts=3)
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        ("fixed_step", False),
+        ("adaptive_step_order_1", False),
+        ("adaptive_step_order_1", True),
+    ],
+    ids=["fixed_step", "adaptive_step_order_1", "adaptive_step_order_1_split"],
+)
+def baseline_profile(request, rosen_optimization_results):
+    """Profiles computed from `rosen_optimization_results` without engine.
+
+    Serves as a reference for the profiles computed with the different
+    engines. Returns the next guess method, the profile options and the
+    profiles.
+    """
+    next_guess_method, split_directions = request.param
+    profile_options = profile.ProfileOptions(split_directions=split_directions)
+    problem, result, optimizer = rosen_optimization_results
+    problem, result = deepcopy((problem, result))
+    with pytest.warns(UserWarning, match="fun and hess as one func"):
+        profile.parameter_profile(
+            problem=problem,
+            result=result,
+            optimizer=optimizer,
+            next_guess_method=next_guess_method,
+            profile_options=profile_options,
+            progress_bar=False,
+        )
+    return next_guess_method, profile_options, result.profile_result.list[0]
+
+
+@pytest.fixture(scope="session")
+def fixed_parameters_optimization_results(rosen_first_order_objective):
+    """Optimization results of a problem with fixed parameters.
+
+    Returns the problem, the result and the optimizer. Tests modifying the
+    problem or the result need to work on copies.
+    """
+    obj = rosen_first_order_objective
+
+    lb = np.full(5, -2.0)
+    ub = np.full(5, 2.0)
+    problem = pypesto.Problem(
+        objective=obj,
+        lb=lb,
+        ub=ub,
+        x_fixed_vals=[0.5, -1.8],
+        x_fixed_indices=[0, 3],
+    )
+
+    optimizer = optimize.ScipyOptimizer(options={"maxiter": 50})
+    result = optimize.minimize(
+        problem=problem,
+        optimizer=optimizer,
+        n_starts=2,
+        progress_bar=False,
+    )
+    return problem, result, optimizer
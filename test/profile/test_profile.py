@@ -2,10 +2,12 @@
 This is for testing profiling of the pypesto.Objective.
 """
 
+import pickle
 import unittest
 import warnings
-from copy import deepcopy
+from copy import copy, deepcopy
 
+import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 from numpy.testing import assert_almost_equal
@@ -14,133 +16,24 @@ import pypesto
 import pypesto.optimize as optimize
 import pypesto.profile as profile
 import pypesto.visualize as visualize
-from pypesto import ObjectiveBase
 
-from ..util import rosen_for_sensi
+from ..util import create_optimization_results, rosen_for_sensi
 from ..visualize import close_fig
 
+# parameter indices to profile, shared by the tests
+PROFILE_INDEX_0 = np.array([0])
+PROFILE_INDEX_1 = np.array([1])
+PROFILE_INDEX_0_2_4 = np.array([0, 2, 4])
 
-class ProfilerTest(unittest.TestCase):
-    @classmethod
-    def setUp(cls):
-        cls.objective: ObjectiveBase = rosen_for_sensi(
-            max_sensi_order=2, integrated=True
-        )["obj"]
-
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            (
-                cls.problem,
-                cls.result,
-                cls.optimizer,
-            ) = create_optimization_results(cls.objective)
-
-    @close_fig
-    def test_default_profiling(self):
-        # loop over  methods for creating new initial guesses
-        method_list = [
-            "fixed_step",
-            "adaptive_step_order_0",
-            "adaptive_step_order_1",
-            "adaptive_step_regression",
-        ]
-        for i_run, method in enumerate(method_list):
-            # run profiling
-            result = profile.parameter_profile(
-                problem=self.problem,
-                result=self.result,
-                optimizer=self.optimizer,
-                next_guess_method=method,
-                progress_bar=False,
-            )
 
-            # check result
-            self.assertTrue(
-                isinstance(
-                    result.profile_result.list[i_run][0],
-                    pypesto.ProfilerResult,
-                )
-            )
-            self.assertEqual(len(result.profile_result.list), i_run + 1)
-            self.assertEqual(len(result.profile_result.list[i_run]), 2)
-
-            # check whether profiling needed maybe too many steps
-            steps = result.profile_result.list[i_run][0]["ratio_path"].size
-            if method == "adaptive_step_regression":
-                self.assertTrue(
-                    steps < 20,
-                    "Profiling with regression based "
-                    "proposal needed too many steps.",
-                )
-                self.assertTrue(
-                    steps > 1,
-                    "Profiling with regression based "
-                    "proposal needed not enough steps.",
-                )
-            elif method == "adaptive_step_order_1":
-                self.assertTrue(
-                    steps < 25,
-                    "Profiling with 1st order based "
-                    "proposal needed too many steps.",
-                )
-                self.assertTrue(
-                    steps > 1,
-                    "Profiling with 1st order based "
-                    "proposal needed not enough steps.",
-                )
-            elif method == "adaptive_step_order_0":
-                self.assertTrue(
-                    steps < 100,
-                    "Profiling with 0th order based "
-                    "proposal needed too many steps.",
-                )
-                self.assertTrue(
-                    steps > 1,
-                    "Profiling with 0th order based "
-                    "proposal needed not enough steps.",
-                )
-
-            # standard plotting
-            visualize.profiles(result, profile_list_ids=i_run)
-            visualize.profile_cis(result, profile_list=i_run)
-
-    def test_engine_profiling(self):
-        # loop over all possible engines
-        # engine=None will be used for comparison
-        engines = [
-            None,
-            pypesto.engine.SingleCoreEngine(),
-            pypesto.engine.MultiProcessEngine(),
-            pypesto.engine.MultiThreadEngine(),
-        ]
-        expected_warns = [
-            pytest.warns(UserWarning, match="fun and hess as one func"),
-            pytest.warns(UserWarning, match="fun and hess as one func"),
-            warnings.catch_warnings(),  # No warnings
-            warnings.catch_warnings(),  # No warnings
-        ]
-        for engine, expected_warn in zip(engines, expected_warns):
-            # run profiling, profile results get appended
-            # in self.result.profile_result
-            with expected_warn:
-                profile.parameter_profile(
-                    problem=self.problem,
-                    result=self.result,
-                    optimizer=self.optimizer,
-                    next_guess_method="fixed_step",
-                    engine=engine,
-                    progress_bar=False,
-                )
-
-        # check results
-        for count, _engine in enumerate(engines[1:]):
-            for j in range(len(self.result.profile_result.list[0])):
-                assert_almost_equal(
-                    self.result.profile_result.list[0][j]["x_path"],
-                    self.result.profile_result.list[count][j]["x_path"],
-                    err_msg="The values of the profiles for"
-                    " the different engines do not match",
-                )
+class ProfilerTest(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _optimization_results(self, rosen_optimization_results):
+        # tests modify the problem and the result, so use copies of the
+        #  optimization results shared by all tests
+        problem, result, optimizer = rosen_optimization_results
+        self.problem, self.result = deepcopy((problem, result))
+        self.optimizer = optimizer
 
     def test_selected_profiling(self):
         # create options in order to ensure a short computation time
@@ -160,7 +53,7 @@ class ProfilerTest(unittest.TestCase):
             problem=self.problem,
             result=self.result,
             optimizer=self.optimizer,
-            profile_index=np.array([1]),
+            profile_index=PROFILE_INDEX_1,
             next_guess_method="fixed_step",
             result_index=1,
             profile_options=options,
@@ -178,7 +71,7 @@ class ProfilerTest(unittest.TestCase):
             problem=self.problem,
             result=result,
             optimizer=self.optimizer,
-            profile_index=np.array([0]),
+            profile_index=PROFILE_INDEX_0,
             result_index=2,
             profile_list=0,
             profile_options=options,
@@ -195,7 +88,7 @@ class ProfilerTest(unittest.TestCase):
             result=result,
             optimizer=self.optimizer,
             next_guess_method="fixed_step",
-            profile_index=np.array([0]),
+            profile_index=PROFILE_INDEX_0,
             profile_options=options,
             progress_bar=False,
         )
@@ -216,8 +109,8 @@ class ProfilerTest(unittest.TestCase):
         )
 
         # set new bounds (knowing that one parameter stopped at the bounds
-        self.problem.lb_full = -4 * np.ones(2)
-        self.problem.ub_full = 4 * np.ones(2)
+        self.problem.lb_full = np.full(2, -4.0)
+        self.problem.ub_full = np.full(2, 4.0)
 
         # re-run profiling using new bounds
         result = profile.parameter_profile(
@@ -225,7 +118,7 @@ class ProfilerTest(unittest.TestCase):
             result=result,
             optimizer=self.optimizer,
             next_guess_method="fixed_step",
-            profile_index=np.array([1]),
+            profile_index=PROFILE_INDEX_1,
             profile_list=0,
             progress_bar=False,
         )
@@ -258,9 +151,15 @@ class ProfilerTest(unittest.TestCase):
         assert len(profile_list[1].ratio_path) == n_steps
         assert profile_list[1].x_path.shape == (2, n_steps)
 
-        # with pre-defined hessian
-        result = deepcopy(self.result)
+        # with pre-defined hessian, only copying what is modified
+        result = copy(self.result)
+        result.optimize_result = copy(self.result.optimize_result)
+        result.optimize_result.list = list(self.result.optimize_result.list)
+        result.optimize_result.list[0] = copy(
+            self.result.optimize_result.list[0]
+        )
         result.optimize_result.list[0].hess = np.array([[2, 0], [0, 1]])
+        assert self.result.optimize_result.list[0].hess is None
         profile.approximate_parameter_profile(
             problem=self.problem,
             result=result,
@@ -269,9 +168,117 @@ class ProfilerTest(unittest.TestCase):
         )
 
 
+@pytest.fixture(params=["single_core", "multi_process", "multi_thread"])
+def engine(request):
+    """Engines to profile with. Worker processes are stopped afterwards."""
+    if request.param == "single_core":
+        yield pypesto.engine.SingleCoreEngine()
+    elif request.param == "multi_process":
+        # the 2-dimensional problem has only two profiles, not worth
+        #  starting one worker per CPU
+        with pypesto.engine.MultiProcessEngine(n_procs=2) as engine:
+            yield engine
+    else:
+        yield pypesto.engine.MultiThreadEngine(n_threads=2)
+
+
+def test_engine_profiling(
+    rosen_optimization_results, baseline_profile, engine
+):
+    next_guess_method, profile_options, baseline_profiles = baseline_profile
+    problem, result, optimizer = rosen_optimization_results
+    problem, result = deepcopy((problem, result))
+
+    if isinstance(engine, pypesto.engine.SingleCoreEngine):
+        expected_warn = pytest.warns(
+            UserWarning, match="fun and hess as one func"
+        )
+    else:
+        expected_warn = warnings.catch_warnings()  # No warnings
+    with expected_warn:
+        profile.parameter_profile(
+            problem=problem,
+            result=result,
+            optimizer=optimizer,
+            next_guess_method=next_guess_method,
+            profile_options=profile_options,
+            engine=engine,
+            progress_bar=False,
+        )
+
+    # compare to the profiles computed without explicit engine
+    for j, baseline_profiler_result in enumerate(baseline_profiles):
+        assert_almost_equal(
+            baseline_profiler_result["x_path"],
+            result.profile_result.list[0][j]["x_path"],
+            err_msg="The values of the profiles for"
+            " the different engines do not match",
+        )
+        assert (
+            baseline_profiler_result["n_fval"]
+            == result.profile_result.list[0][j]["n_fval"]
+        )
+
+
+# maximum number of profile steps expected per next guess method
+MAX_STEPS = {
+    "adaptive_step_regression": 20,
+    "adaptive_step_order_1": 25,
+    "adaptive_step_order_0": 100,
+}
+
+
+@close_fig
+@pytest.mark.parametrize(
+    "method",
+    [
+        "fixed_step",
+        "adaptive_step_order_0",
+        "adaptive_step_order_1",
+        "adaptive_step_regression",
+    ],
+)
+def test_default_profiling(rosen_optimization_results, method):
+    problem, result, optimizer = rosen_optimization_results
+    problem, result = deepcopy((problem, result))
+
+    # run profiling
+    result = profile.parameter_profile(
+        problem=problem,
+        result=result,
+        optimizer=optimizer,
+        next_guess_method=method,
+        progress_bar=False,
+    )
+
+    # check result
+    profile_lists = result.profile_result.list
+    profile_list = profile_lists[0]
+    profiler_result = profile_list[0]
+    assert isinstance(profiler_result, pypesto.ProfilerResult)
+    assert len(profile_lists) == 1
+    assert len(profile_list) == 2
+
+    # check whether profiling needed maybe too many steps
+    steps = profiler_result["ratio_path"].size
+    if method in MAX_STEPS:
+        assert (
+            steps < MAX_STEPS[method]
+        ), f"Profiling with {method} proposal needed too many steps."
+        assert (
+            steps > 1
+        ), f"Profiling with {method} proposal needed not enough steps."
+
+    # standard plotting
+    visualize.profiles(result, profile_list_ids=0)
+    plt.close("all")
+    visualize.profile_cis(result, profile_list=0)
+
+
 # dont make this a class method such that we dont optimize twice
 def test_profile_with_history():
-    objective = rosen_for_sensi(max_sensi_order=2, integrated=False)["obj"]
+    # the optimizer uses no Hessians
+    objective = rosen_for_sensi(max_sensi_order=1, integrated=False)["obj"]
 
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
@@ -286,71 +293,65 @@ def test_profile_with_history():
         ratio_min=0.03,
     )
 
-    problem.fix_parameters(
-        [0, 3],
-        [
-            result.optimize_result.list[0].x[0],
-            result.optimize_result.list[0].x[3],
-        ],
-    )
+    x_opt = result.optimize_result.list[0].x
+    problem.fix_parameters([0, 3], x_opt[[0, 3]].tolist())
     problem.objective.history = pypesto.MemoryHistory({"trace_record": True})
     profile.parameter_profile(
         problem=problem,
         result=result,
         optimizer=optimizer,
-        profile_index=np.array([0, 2, 4]),
+        profile_index=PROFILE_INDEX_0_2_4,
         result_index=0,
         profile_options=profile_options,
         progress_bar=False,
     )
 
+    # only the free parameters are profiled
+    profile_list = result.profile_result.list[0]
+    assert not profile_list[0].done
+    assert profile_list[2].done
+    assert profile_list[4].done
+
 
 @close_fig
-def test_profile_with_fixed_parameters():
+@pytest.mark.parametrize(
+    "next_guess_method",
+    [
+        "fixed_step",
+        "adaptive_step_order_0",
+        "adaptive_step_order_1",
+        "adaptive_step_regression",
+    ],
+)
+def test_profile_with_fixed_parameters(
+    fixed_parameters_optimization_results, next_guess_method
+):
     """Test using profiles with fixed parameters."""
-    obj = rosen_for_sensi(max_sensi_order=1)["obj"]
+    problem, result, optimizer = fixed_parameters_optimization_results
+    problem, result = deepcopy((problem, result))
 
-    lb = -2 * np.ones(5)
-    ub = 2 * np.ones(5)
-    problem = pypesto.Problem(
-        objective=obj,
-        lb=lb,
-        ub=ub,
-        x_fixed_vals=[0.5, -1.8],
-        x_fixed_indices=[0, 3],
-    )
-
-    optimizer = optimize.ScipyOptimizer(options={"maxiter": 50})
-    result = optimize.minimize(
+    profile.parameter_profile(
         problem=problem,
+        result=result,
         optimizer=optimizer,
-        n_starts=2,
+        next_guess_method=next_guess_method,
         progress_bar=False,
     )
 
-    for i_method, next_guess_method in enumerate(
-        [
-            "fixed_step",
-            "adaptive_step_order_0",
-            "adaptive_step_order_1",
-            "adaptive_step_regression",
-        ]
-    ):
-        print(next_guess_method)
-        profile.parameter_profile(
-            problem=problem,
-            result=result,
-            optimizer=optimizer,
-            next_guess_method=next_guess_method,
-            progress_bar=False,
-        )
+    # standard plotting
+    axes = visualize.profiles(result, profile_list_ids=0)
+    assert len(axes) == 3
+    plt.close("all")
+    visualize.profile_cis(result, profile_list=0)
+
 
-        # standard plotting
-        axes = visualize.profiles(result, profile_list_ids=i_method)
-        assert len(axes) == 3
-        visualize.profile_cis(result, profile_list=i_method)
+def test_profile_with_all_but_one_parameter_fixed(
+    fixed_parameters_optimization_results,
+):
+    """Test profiling with all parameters fixed but one."""
+    problem, result, optimizer = fixed_parameters_optimization_results
+    problem, result = deepcopy((problem, result))
 
-    # test profiling with all parameters fixed but one
     problem.fix_parameters([2, 3, 4], result.optimize_result.list[0]["x"][2:5])
     profile.parameter_profile(
         problem=problem,
@@ -361,28 +362,70 @@ def test_profile_with_fixed_parameters():
     )
 
 
-def create_optimization_results(objective, dim_full=2):
-    # create optimizer, pypesto problem and options
-    options = {"maxiter": 200}
-    optimizer = optimize.ScipyOptimizer(method="l-bfgs-b", options=options)
-
-    lb = -2 * np.ones(dim_full)
-    ub = 2 * np.ones(dim_full)
-    problem = pypesto.Problem(objective, lb, ub)
+def test_profile_resume():
+    """Test that completed profiles are skipped when resuming."""
+    problem, result, optimizer = create_optimization_results(
+        rosen_for_sensi(max_sensi_order=1)["obj"], dim_full=3
+    )
+    profile_options = profile.ProfileOptions(resume=True)
 
-    optimize_options = optimize.OptimizeOptions(allow_failed_starts=True)
+    profile.parameter_profile(
+        problem=problem,
+        result=result,
+        optimizer=optimizer,
+        profile_index=[0],
+        profile_options=profile_options,
+        progress_bar=False,
+    )
+    profile_0 = result.profile_result.get_profiler_result(i_par=0)
+    assert profile_0.done
+    assert result.profile_result.get_profiler_result(i_par=1) is None
 
-    # run optimization
-    result = optimize.minimize(
+    # add another parameter to the existing profile list
+    profile.parameter_profile(
         problem=problem,
+        result=result,
         optimizer=optimizer,
-        n_starts=5,
-        startpoint_method=pypesto.startpoint.uniform,
-        options=optimize_options,
+        profile_index=[0, 1],
+        profile_list=0,
+        profile_options=profile_options,
         progress_bar=False,
     )
+    assert len(result.profile_result.list) == 1
+    assert result.profile_result.get_profiler_result(i_par=0) is profile_0
+    assert result.profile_result.get_profiler_result(i_par=1).done
 
-    return problem, result, optimizer
+
+def test_profiler_result_append_and_flip():
+    """Test appending points to and flipping a ProfilerResult."""
+    profiler_result = pypesto.result.ProfilerResult(
+        x_path=np.array([[0.0], [1.0]]),
+        fval_path=np.array([0.0]),
+        ratio_path=np.array([1.0]),
+    )
+    for i in range(1, 5):
+        profiler_result.append_profile_point(
+            x=np.array([i, 1.0]), fval=i, ratio=1 / (i + 1), time=1.0
+        )
+    # copies must not share the underlying storage
+    profiler_copy = deepcopy(profiler_result)
+    profiler_shallow_copy = copy(profiler_result)
+    profiler_result.flip_profile()
+    profiler_result.append_profile_point(
+        x=np.array([-1.0, 1.0]), fval=5, ratio=0, time=1.0
+    )
+
+    assert_almost_equal(profiler_result.x_path[0], [4, 3, 2, 1, 0, -1])
+    assert_almost_equal(profiler_result.fval_path, [4, 3, 2, 1, 0, 5])
+    assert_almost_equal(profiler_copy.fval_path, [0, 1, 2, 3, 4])
+    assert_almost_equal(profiler_shallow_copy.fval_path, [0, 1, 2, 3, 4])
+    assert profiler_result.x_path.shape == (2, 6)
+    assert profiler_result.time_total == 5.0
+
+    # only the paths are pickled, not the buffers backing them
+    unpickled = pickle.loads(pickle.dumps(profiler_result))  # noqa: S301
+    assert "_buffers" not in unpickled.__dict__
+    assert_almost_equal(unpickled.fval_path, profiler_result.fval_path)
 
 
 def test_chi2_quantile_to_ratio():
@@ -446,17 +489,16 @@ def test_options_valid():
 
 @pytest.mark.parametrize(
     "lb,ub",
-    [(6 * np.ones(5), 10 * np.ones(5)), (-4 * np.ones(5), 1 * np.ones(5))],
+    [(np.full(5, 6.0), np.full(5, 10.0)), (np.full(5, -4.0), np.full(5, 1.0))],
+    ids=["pos_bounds", "neg_bounds"],
 )
-def test_gh1165(lb, ub):
+def test_gh1165(rosen_first_order_objective, lb, ub):
     """Regression test for https://github.com/ICB-DCM/pyPESTO/issues/1165
 
     Check profiles with non-symmetric bounds and whole_path=True span the full parameter domain.
     """
-    obj = rosen_for_sensi(max_sensi_order=1)["obj"]
-
     problem = pypesto.Problem(
-        objective=obj,
+        objective=rosen_first_order_objective,
         lb=lb,
         ub=ub,
     )
@@ -488,5 +530,5 @@ def test_gh1165(lb, ub):
     # parameter value of the profiled parameter
     x_path = result.profile_result.list[0][par_idx]["x_path"][par_idx, :]
     # ensure we cover lb..ub
-    assert x_path[0] == lb[par_idx], (x_path.min(), lb[par_idx])
-    assert x_path[-1] == ub[par_idx], (x_path.max(), ub[par_idx])
+    assert x_path[0] == lb[par_idx], f"start {x_path[0]} != lb {lb[par_idx]}"
+    assert x_path[-1] == ub[par_idx], f"end {x_path[-1]} != ub {ub[par_idx]}"
@@ -1,8 +1,11 @@
 """Various test problems and utility functions."""
 
+import copy
+import functools
 import importlib
 import os
 import sys
+from collections.abc import Sequence
 
 import autograd.numpy as anp
 import numpy as np
@@ -10,6 +13,7 @@ import scipy.optimize as so
 from autograd import jacobian
 
 import pypesto
+import pypesto.optimize as optimize
 
 try:
     import amici
@@ -108,6 +112,35 @@ def rosen_for_sensi(max_sensi_order, integrated=False, x=None):
     )
 
 
+def create_optimization_results(objective, dim_full=2, n_starts=2):
+    """Optimize `objective` on [-2, 2]^dim_full, for profiling tests."""
+    # create optimizer, pypesto problem and options
+    options = {"maxiter": 50}
+    optimizer = pypesto.optimize.ScipyOptimizer(
+        method="l-bfgs-b", options=options
+    )
+
+    lb = np.full(dim_full, -2.0)
+    ub = np.full(dim_full, 2.0)
+    problem = pypesto.Problem(objective, lb, ub)
+
+    optimize_options = pypesto.optimize.OptimizeOptions(
+        allow_failed_starts=True
+    )
+
+    # run optimization
+    result = pypesto.optimize.minimize(
+        problem=problem,
+        optimizer=optimizer,
+        n_starts=n_starts,
+        startpoint_method=pypesto.startpoint.uniform,
+        options=optimize_options,
+        progress_bar=False,
+    )
+
+    return problem, result, optimizer
+
+
 def poly_for_sensi(max_sensi_order, integrated=False, x=0.0):
     """1-dim polynomial for testing in 1d."""
 
@@ -324,3 +357,234 @@ def load_amici_objective(example_name):
     edata = amici.ExpData(rdata, 0.05, 0.0)
 
     return (pypesto.AmiciObjective(model, solver, [edata], 2), model)
+
+
+# directory of the example problems
+EXAMPLE_DIR = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.realpath(__file__)),
+        "..",
+        "doc",
+        "example",
+    )
+)
+
+
+@functools.lru_cache(maxsize=8)
+def create_bounds(n_parameters: int = 2):
+    # define bounds for a pypesto problem, shared between calls
+    lb = np.full((1, n_parameters), -7.0)
+    ub = np.full((1, n_parameters), 7.0)
+    lb.setflags(write=False)
+    ub.setflags(write=False)
+
+    return lb, ub
+
+
+def create_problem(
+    n_parameters: int = 2,
+    x_names: Sequence[str] = None,
+    with_hess: bool = False,
+):
+    # define a pypesto objective, the Hessian is only needed on request
+    objective = pypesto.Objective(
+        fun=so.rosen,
+        grad=so.rosen_der,
+        hess=so.rosen_hess if with_hess else None,
+        x_names=x_names,
+    )
+
+    # define a pypesto problem
+    (lb, ub) = create_bounds(n_parameters)
+    problem = pypesto.Problem(objective=objective, lb=lb, ub=ub)
+
+    return problem
+
+
+@functools.lru_cache(maxsize=None)
+def import_conversion_reaction():
+    """Import the conversion reaction example.
+
+    The PEtab files are only imported once, the returned PEtab and pypesto
+    problems are shared and must not be modified.
+    """
+    import petab
+
+    import pypesto.petab
+
+    # import to petab
+    petab_problem = petab.Problem.from_yaml(
+        os.path.join(
+            EXAMPLE_DIR, "conversion_reaction", "conversion_reaction.yaml"
+        )
+    )
+    # import to pypesto
+    importer = pypesto.petab.PetabImporter(petab_problem)
+    # create problem
+    problem = importer.create_problem()
+
+    return petab_problem, problem
+
+
+def create_petab_problem():
+    """Get a copy of the conversion reaction problem.
+
+    The PEtab files are only imported once, callers may modify the copy.
+    """
+    _, problem = import_conversion_reaction()
+    return copy.deepcopy(problem)
+
+
+def _bulk_append(result, optimizer_results):
+    """Append optimizer results to a result, sorting only once."""
+    for optimizer_result in optimizer_results:
+        result.optimize_result.append(
+            optimize_result=optimizer_result, sort=False
+        )
+    result.optimize_result.sort()
+
+
+def create_optimization_result(n=4):
+    # create the pypesto problem
+    problem = create_problem()
+
+    # write some dummy results for optimization: 3 results close to the
+    #  optimum, followed by `n` results with higher function values
+    k_opt = np.arange(3)
+    k = np.arange(n)
+    fvals = np.concatenate([k_opt * 0.01, 10 + k * 0.01])
+    xs = np.concatenate(
+        [
+            np.column_stack([k_opt + 0.1, k_opt + 1]),
+            np.column_stack([2.5 + k + 0.1, 2 + k + 1]),
+        ]
+    )
+    grads = np.concatenate(
+        [
+            np.column_stack([2.5 + k_opt + 0.1, 2 + k_opt + 1]),
+            np.column_stack([k + 0.1, k + 1]),
+        ]
+    )
+
+    result = pypesto.Result(problem=problem)
+    _bulk_append(
+        result,
+        [
+            pypesto.OptimizerResult(id=str(i), fval=fval, x=x, grad=grad)
+            for i, (fval, x, grad) in enumerate(zip(fvals, xs, grads))
+        ],
+    )
+
+    return result
+
+
+def create_optimization_result_nan_inf():
+    """
+    Create a result object containing nan and inf function values
+    """
+    # get result with only numbers
+    result = create_optimization_result()
+
+    # append nan and inf
+    # depending on optimizer failed starts's x can be None or vector of np.nan
+    _bulk_append(
+        result,
+        [
+            pypesto.OptimizerResult(
+                fval=float("nan"),
+                x=np.array([float("nan"), float("nan")]),
+                id="nan",
+            ),
+            pypesto.OptimizerResult(fval=float("nan"), x=None, id="nan_none"),
+            pypesto.OptimizerResult(
+                fval=-float("inf"),
+                x=np.array([-float("inf"), -float("inf")]),
+                id="inf",
+            ),
+        ],
+    )
+
+    return result
+
+
+def create_optimization_history():
+    # create the pypesto problem
+    problem = create_problem()
+
+    # create optimizer
+    optimizer_options = {"maxfun": 200}
+    optimizer = optimize.ScipyOptimizer(
+        method="TNC", options=optimizer_options
+    )
+
+    history_options = pypesto.HistoryOptions(
+        trace_record=True, trace_save_iter=1
+    )
+
+    # run optimization
+    optimize_options = optimize.OptimizeOptions(allow_failed_starts=True)
+    result_with_trace = optimize.minimize(
+        problem=problem,
+        optimizer=optimizer,
+        n_starts=5,
+        options=optimize_options,
+        history_options=history_options,
+        progress_bar=False,
+    )
+
+    return result_with_trace
+
+
+def create_profile_result():
+    # create a pypesto result
+    result = create_optimization_result()
+
+    # write some dummy results for profiling
+    ratio_path_1 = np.array([0.15, 0.25, 0.7, 1.0, 0.8, 0.35, 0.15])
+    ratio_path_2 = np.array([0.1, 0.2, 0.7, 1.0, 0.8, 0.3, 0.1])
+    x_path_1 = np.array(
+        [
+            [2.0, 2.1, 2.3, 2.5, 2.7, 2.9, 3.0],
+            [1.0, 1.2, 1.4, 1.5, 1.6, 1.8, 2.0],
+        ]
+    )
+    x_path_2 = np.array(
+        [
+            [1.0, 1.1, 1.3, 1.5, 1.7, 1.9, 2.1],
+            [2.1, 2.2, 2.4, 2.5, 2.8, 2.9, 3.1],
+        ]
+    )
+    fval_path_1 = np.array([4.0, 3.0, 1.0, 0.0, 1.5, 2.5, 5.0])
+    fval_path_2 = np.array([4.5, 3.5, 1.5, 0.0, 1.3, 2.3, 4.3])
+    tmp_result_1 = pypesto.ProfilerResult(x_path_1, fval_path_1, ratio_path_1)
+    tmp_result_2 = pypesto.ProfilerResult(x_path_2, fval_path_2, ratio_path_2)
+
+    # use pypesto function to write the numeric values into the results
+    result.profile_result.append_empty_profile_list()
+    result.profile_result.append_profiler_result(tmp_result_1)
+    result.profile_result.append_profiler_result(tmp_result_2)
+
+    return result
+
+
+def create_sampling_result():
+    """Create a result object containing sample results."""
+    result = create_optimization_result()
+    n_chain = 2
+    n_iter = 100
+    n_par = len(result.optimize_result.x[0])
+    rng = np.random.default_rng(0)
+    trace_neglogpost = rng.standard_normal((n_chain, n_iter))
+    trace_neglogprior = np.zeros((n_chain, n_iter))
+    trace_x = rng.standard_normal((n_chain, n_iter, n_par))
+    betas = np.array([1, 0.1])
+    sample_result = pypesto.McmcPtResult(
+        trace_neglogpost=trace_neglogpost,
+        trace_neglogprior=trace_neglogprior,
+        trace_x=trace_x,
+        betas=betas,
+        burn_in=10,
+    )
+    result.sample_result = sample_result
+
+    return result
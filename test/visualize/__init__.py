@@ -1,8 +1,8 @@
 """Visualization tests."""
 
-from .test_visualize import (
-    close_fig,
+from ..util import (
     create_optimization_result,
     create_petab_problem,
     create_problem,
 )
+from .test_visualize import close_fig
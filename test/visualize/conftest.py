@@ -0,0 +1,90 @@
+import matplotlib
+import matplotlib.pyplot as plt
+import pytest
+
+import pypesto.optimize as optimize
+
+from ..util import (
+    create_optimization_history,
+    create_optimization_result,
+    create_optimization_result_nan_inf,
+    create_profile_result,
+    create_sampling_result,
+    import_conversion_reaction,
+)
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close all figures after each test."""
+    yield
+    if plt.get_fignums():
+        plt.close("all")
+
+
+@pytest.fixture(autouse=True)
+def cheap_rendering():
+    """Keep rendering cheap, as figures are never shown or compared."""
+    with matplotlib.rc_context(
+        {
+            "figure.dpi": 50,
+            "savefig.dpi": 50,
+            "figure.autolayout": False,
+            "text.hinting": "none",
+            "path.simplify": True,
+            "path.simplify_threshold": 1.0,
+            "agg.path.chunksize": 10000,
+        }
+    ):
+        yield
+
+
+# The results are shared by all tests. Tests modifying them need to work on
+#  copies.
+
+
+@pytest.fixture(scope="session")
+def optimization_result():
+    """Result with dummy optimization results."""
+    return create_optimization_result()
+
+
+@pytest.fixture(scope="session")
+def optimization_result_nan_inf():
+    """Result with dummy optimization results, including nan and inf."""
+    return create_optimization_result_nan_inf()
+
+
+@pytest.fixture(scope="session")
+def optimization_history():
+    """Result of an optimization with recorded history."""
+    return create_optimization_history()
+
+
+@pytest.fixture(scope="session")
+def profile_result():
+    """Result with dummy profiling results."""
+    return create_profile_result()
+
+
+@pytest.fixture(scope="session")
+def sampling_result():
+    """Result with dummy sampling results."""
+    return create_sampling_result()
+
+
+@pytest.fixture(scope="session")
+def conversion_reaction_problem():
+    """PEtab and pypesto problem of the conversion reaction example."""
+    return import_conversion_reaction()
+
+
+@pytest.fixture(scope="session")
+def conversion_reaction_result(conversion_reaction_problem):
+    """Optimization result of the conversion reaction example."""
+    _, problem = conversion_reaction_problem
+    return optimize.minimize(
+        problem=problem,
+        n_starts=1,
+        progress_bar=False,
+    )
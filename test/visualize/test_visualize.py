@@ -1,14 +1,14 @@
+import contextlib
+import copy
 import functools
-import logging
 import os
-from collections.abc import Sequence
+import subprocess  # noqa: S404
+import sys
 from functools import wraps
 
 import matplotlib.pyplot as plt
 import numpy as np
-import petab
 import pytest
-import scipy.optimize as so
 
 import pypesto
 import pypesto.ensemble as ensemble
@@ -21,9 +21,12 @@ import pypesto.visualize as visualize
 from pypesto.testing.examples import (
     get_Boehm_JProteomeRes2014_hierarchical_petab_corrected_bounds,
 )
-from pypesto.visualize.model_fit import (
-    time_trajectory_model,
-    visualize_optimized_model_fit,
+
+from ..util import (
+    create_bounds,
+    create_optimization_result,
+    create_petab_problem,
+    create_problem,
 )
 
 
@@ -42,47 +45,10 @@ def close_fig(fun):
 # Define some helper functions, to have the test code more readable
 
 
-def create_bounds(n_parameters: int = 2):
-    # define bounds for a pypesto problem
-    lb = -7 * np.ones((1, n_parameters))
-    ub = 7 * np.ones((1, n_parameters))
-
-    return lb, ub
-
-
-def create_problem(n_parameters: int = 2, x_names: Sequence[str] = None):
-    # define a pypesto objective
-    objective = pypesto.Objective(
-        fun=so.rosen, grad=so.rosen_der, hess=so.rosen_hess, x_names=x_names
-    )
-
-    # define a pypesto problem
-    (lb, ub) = create_bounds(n_parameters)
-    problem = pypesto.Problem(objective=objective, lb=lb, ub=ub)
-
-    return problem
-
-
-def create_petab_problem():
-    current_path = os.path.dirname(os.path.realpath(__file__))
-    dir_path = os.path.abspath(
-        os.path.join(current_path, "..", "..", "doc", "example")
-    )
-
-    # import to petab
-    petab_problem = petab.Problem.from_yaml(
-        dir_path + "/conversion_reaction/conversion_reaction.yaml"
-    )
-    # import to pypesto
-    importer = pypesto.petab.PetabImporter(petab_problem)
-    # create problem
-    problem = importer.create_problem()
-
-    return problem
-
-
-def sample_petab_problem():
-    # create problem
+@functools.lru_cache(maxsize=None)
+def _sample_petab_problem():
+    # sampling sets the history and the model parameters of the objective,
+    #  so sample from a copy of the shared problem
     problem = create_petab_problem()
 
     sampler = sample.AdaptiveMetropolisSampler(
@@ -99,117 +65,12 @@ def sample_petab_problem():
     return result
 
 
-def create_optimization_result(n=4):
-    # create the pypesto problem
-    problem = create_problem()
-
-    # write some dummy results for optimization
-    result = pypesto.Result(problem=problem)
-    for k in range(0, 3):
-        optimizer_result = pypesto.OptimizerResult(
-            id=str(k),
-            fval=k * 0.01,
-            x=np.array([k + 0.1, k + 1]),
-            grad=np.array([2.5 + k + 0.1, 2 + k + 1]),
-        )
-        result.optimize_result.append(optimize_result=optimizer_result)
-    for k in range(0, n):
-        optimizer_result = pypesto.OptimizerResult(
-            id=str(k + 3),
-            fval=10 + k * 0.01,
-            x=np.array([2.5 + k + 0.1, 2 + k + 1]),
-            grad=np.array([k + 0.1, k + 1]),
-        )
-        result.optimize_result.append(optimize_result=optimizer_result)
-
-    return result
-
+def sample_petab_problem():
+    """Get a copy of the sampling result of the conversion reaction problem.
 
-def create_optimization_result_nan_inf():
-    """
-    Create a result object containing nan and inf function values
+    Sampling is only run once, callers may modify the copy.
     """
-    # get result with only numbers
-    result = create_optimization_result()
-
-    # append nan and inf
-    # depending on optimizer failed starts's x can be None or vector of np.nan
-    optimizer_result = pypesto.OptimizerResult(
-        fval=float("nan"), x=np.array([float("nan"), float("nan")]), id="nan"
-    )
-    result.optimize_result.append(optimize_result=optimizer_result)
-    optimizer_result = pypesto.OptimizerResult(
-        fval=float("nan"), x=None, id="nan_none"
-    )
-    result.optimize_result.append(optimize_result=optimizer_result)
-    optimizer_result = pypesto.OptimizerResult(
-        fval=-float("inf"),
-        x=np.array([-float("inf"), -float("inf")]),
-        id="inf",
-    )
-    result.optimize_result.append(optimize_result=optimizer_result)
-
-    return result
-
-
-def create_optimization_history():
-    # create the pypesto problem
-    problem = create_problem()
-
-    # create optimizer
-    optimizer_options = {"maxfun": 200}
-    optimizer = optimize.ScipyOptimizer(
-        method="TNC", options=optimizer_options
-    )
-
-    history_options = pypesto.HistoryOptions(
-        trace_record=True, trace_save_iter=1
-    )
-
-    # run optimization
-    optimize_options = optimize.OptimizeOptions(allow_failed_starts=True)
-    result_with_trace = optimize.minimize(
-        problem=problem,
-        optimizer=optimizer,
-        n_starts=5,
-        options=optimize_options,
-        history_options=history_options,
-        progress_bar=False,
-    )
-
-    return result_with_trace
-
-
-def create_profile_result():
-    # create a pypesto result
-    result = create_optimization_result()
-
-    # write some dummy results for profiling
-    ratio_path_1 = np.array([0.15, 0.25, 0.7, 1.0, 0.8, 0.35, 0.15])
-    ratio_path_2 = np.array([0.1, 0.2, 0.7, 1.0, 0.8, 0.3, 0.1])
-    x_path_1 = np.array(
-        [
-            [2.0, 2.1, 2.3, 2.5, 2.7, 2.9, 3.0],
-            [1.0, 1.2, 1.4, 1.5, 1.6, 1.8, 2.0],
-        ]
-    )
-    x_path_2 = np.array(
-        [
-            [1.0, 1.1, 1.3, 1.5, 1.7, 1.9, 2.1],
-            [2.1, 2.2, 2.4, 2.5, 2.8, 2.9, 3.1],
-        ]
-    )
-    fval_path_1 = [4.0, 3.0, 1.0, 0.0, 1.5, 2.5, 5.0]
-    fval_path_2 = [4.5, 3.5, 1.5, 0.0, 1.3, 2.3, 4.3]
-    tmp_result_1 = pypesto.ProfilerResult(x_path_1, fval_path_1, ratio_path_1)
-    tmp_result_2 = pypesto.ProfilerResult(x_path_2, fval_path_2, ratio_path_2)
-
-    # use pypesto function to write the numeric values into the results
-    result.profile_result.append_empty_profile_list()
-    result.profile_result.append_profiler_result(tmp_result_1)
-    result.profile_result.append_profiler_result(tmp_result_2)
-
-    return result
+    return copy.deepcopy(_sample_petab_problem())
 
 
 def create_plotting_options():
@@ -247,11 +108,10 @@ def post_processor(
     return outputs
 
 
-@close_fig
-def test_waterfall_w_zoom():
+def test_waterfall_w_zoom(optimization_result):
     # create the necessary results
     result_1 = create_optimization_result(500)
-    result_2 = create_optimization_result()
+    result_2 = optimization_result
 
     # test a standard call
     visualize.waterfall(result_1, n_starts_to_zoom=10)
@@ -260,24 +120,13 @@ def test_waterfall_w_zoom():
     visualize.waterfall([result_1, result_2], n_starts_to_zoom=3)
 
 
-@close_fig
-def test_waterfall():
-    # create the necessary results
-    result_1 = create_optimization_result()
-    result_2 = create_optimization_result()
-
-    # test a standard call
-    visualize.waterfall(result_1)
-
-    # test plotting of lists
-    visualize.waterfall([result_1, result_2])
-
-
-@close_fig
-def test_waterfall_with_nan_inf():
-    # create the necessary results, one with nan and inf, one without
-    result_1 = create_optimization_result_nan_inf()
-    result_2 = create_optimization_result()
+@pytest.mark.parametrize(
+    "result_fixture", ["optimization_result", "optimization_result_nan_inf"]
+)
+def test_waterfall(result_fixture, optimization_result, request):
+    # create the necessary results, the second one without nan and inf
+    result_1 = request.getfixturevalue(result_fixture)
+    result_2 = optimization_result
 
     # test a standard call
     visualize.waterfall(result_1)
@@ -286,48 +135,72 @@ def test_waterfall_with_nan_inf():
     visualize.waterfall([result_1, result_2])
 
 
-@close_fig
-def test_waterfall_with_options():
-    # create the necessary results
-    result_1 = create_optimization_result()
-    result_2 = create_optimization_result()
-
-    # alternative figure size and plotting options
-    (_, _, ref3, _, ref_point) = create_plotting_options()
-    alt_fig_size = (9.0, 8.0)
-
-    with pytest.warns(UserWarning, match="Invalid lower bound"):
-        # Test with y-limits as vector and invalid lower bound
-        visualize.waterfall(
-            result_1,
-            reference=ref_point,
-            y_limits=[-0.5, 2.5],
-            start_indices=[0, 1, 4, 11],
-            size=alt_fig_size,
-            colors=[1.0, 0.3, 0.3, 0.5],
-        )
+# alternative figure size and plotting options, together with whether a list
+#  of results is plotted and the expected warning
+_, _, REF3, _, REF_POINT = create_plotting_options()
+WATERFALL_OPTIONS = [
+    # y-limits as vector and invalid lower bound
+    pytest.param(
+        {
+            "reference": REF_POINT,
+            "y_limits": [-0.5, 2.5],
+            "start_indices": [0, 1, 4, 11],
+            "size": (9.0, 8.0),
+            "colors": [1.0, 0.3, 0.3, 0.5],
+        },
+        False,
+        "Invalid lower bound",
+        id="invalid_lower_bound",
+    ),
+    # fully invalid bounds
+    pytest.param(
+        {"y_limits": [-1.5, 0.0]}, False, "Invalid bounds", id="invalid_bounds"
+    ),
+    # y-limits as float
+    pytest.param(
+        {
+            "reference": REF3,
+            "offset_y": -2.5,
+            "start_indices": 3,
+            "y_limits": 5.0,
+        },
+        True,
+        "Offset specified by user",
+        id="y_limits_float",
+    ),
+    # linear scale
+    pytest.param(
+        {
+            "reference": REF3,
+            "scale_y": "lin",
+            "offset_y": 0.2,
+            "y_limits": 5.0,
+        },
+        False,
+        None,
+        id="linear_scale",
+    ),
+]
 
-    # Test with fully invalid bounds
-    with pytest.warns(UserWarning, match="Invalid bounds"):
-        visualize.waterfall(result_1, y_limits=[-1.5, 0.0])
 
-    # Test with y-limits as float
-    with pytest.warns(UserWarning, match="Offset specified by user"):
-        visualize.waterfall(
-            [result_1, result_2],
-            reference=ref3,
-            offset_y=-2.5,
-            start_indices=3,
-            y_limits=5.0,
-        )
+@pytest.mark.parametrize(
+    "kwargs,plot_list,expected_warning", WATERFALL_OPTIONS
+)
+def test_waterfall_with_options(
+    optimization_result, kwargs, plot_list, expected_warning
+):
+    results = optimization_result
+    if plot_list:
+        results = [optimization_result, optimization_result]
 
-    # Test with linear scale
-    visualize.waterfall(
-        result_1, reference=ref3, scale_y="lin", offset_y=0.2, y_limits=5.0
-    )
+    if expected_warning is None:
+        context = contextlib.nullcontext()
+    else:
+        context = pytest.warns(UserWarning, match=expected_warning)
+    with context:
+        visualize.waterfall(results, **kwargs)
 
 
-@close_fig
 def test_waterfall_lowlevel():
     # test empty input
     visualize.waterfall_lowlevel([])
@@ -340,11 +213,13 @@ def test_waterfall_lowlevel():
 
 
 @pytest.mark.parametrize("scale_to_interval", [None, (0, 1)])
-@close_fig
-def test_parameters(scale_to_interval):
+@pytest.mark.parametrize(
+    "result_fixture", ["optimization_result", "optimization_result_nan_inf"]
+)
+def test_parameters(result_fixture, scale_to_interval, request):
     # create the necessary results
-    result_1 = create_optimization_result()
-    result_2 = create_optimization_result()
+    result_1 = request.getfixturevalue(result_fixture)
+    result_2 = result_1
 
     # test a standard call
     visualize.parameters(result_1, scale_to_interval=scale_to_interval)
@@ -355,61 +230,51 @@ def test_parameters(scale_to_interval):
     )
 
 
-@pytest.mark.parametrize("scale_to_interval", [None, (0, 1)])
-@close_fig
-def test_parameters_with_nan_inf(scale_to_interval):
-    # create the necessary results
-    result_1 = create_optimization_result_nan_inf()
-    result_2 = create_optimization_result_nan_inf()
-
-    # test a standard call
-    visualize.parameters(result_1, scale_to_interval=scale_to_interval)
-
-    # test plotting of lists
-    visualize.parameters(
-        [result_1, result_2], scale_to_interval=scale_to_interval
-    )
+# alternative figure size and plotting options, together with whether a list
+#  of results is plotted
+PARAMETERS_OPTIONS = [
+    pytest.param(
+        {
+            "parameter_indices": "all",
+            "reference": REF_POINT,
+            "size": (9.0, 8.0),
+            "colors": [1.0, 0.3, 0.3, 0.5],
+        },
+        False,
+        id="single",
+    ),
+    pytest.param(
+        {
+            "parameter_indices": "all",
+            "reference": REF_POINT,
+            "balance_alpha": False,
+            "start_indices": (0, 1, 4),
+        },
+        True,
+        id="list",
+    ),
+    pytest.param(
+        {"parameter_indices": "free_only", "start_indices": 3},
+        True,
+        id="list_free_only",
+    ),
+]
 
 
 @pytest.mark.parametrize("scale_to_interval", [None, (0, 1)])
-@close_fig
-def test_parameters_with_options(scale_to_interval):
-    # create the necessary results
-    result_1 = create_optimization_result()
-    result_2 = create_optimization_result()
-
-    # alternative figure size and plotting options
-    (_, _, _, _, ref_point) = create_plotting_options()
-    alt_fig_size = (9.0, 8.0)
-
-    # test calls with specific options
-    visualize.parameters(
-        result_1,
-        parameter_indices="all",
-        reference=ref_point,
-        size=alt_fig_size,
-        colors=[1.0, 0.3, 0.3, 0.5],
-        scale_to_interval=scale_to_interval,
-    )
-
-    visualize.parameters(
-        [result_1, result_2],
-        parameter_indices="all",
-        reference=ref_point,
-        balance_alpha=False,
-        start_indices=(0, 1, 4),
-        scale_to_interval=scale_to_interval,
-    )
+@pytest.mark.parametrize("kwargs,plot_list", PARAMETERS_OPTIONS)
+def test_parameters_with_options(
+    optimization_result, kwargs, plot_list, scale_to_interval
+):
+    results = optimization_result
+    if plot_list:
+        results = [optimization_result, optimization_result]
 
     visualize.parameters(
-        [result_1, result_2],
-        parameter_indices="free_only",
-        start_indices=3,
-        scale_to_interval=scale_to_interval,
+        results, scale_to_interval=scale_to_interval, **kwargs
     )
 
 
-@close_fig
 def test_parameters_lowlevel():
     # create some dummy results
     (lb, ub) = create_bounds()
@@ -441,7 +306,6 @@ def test_parameters_lowlevel():
     visualize.parameters_lowlevel(xs, fvals)
 
 
-@close_fig
 def test_parameters_hist():
     # create the pypesto problem
     problem = create_problem()
@@ -464,9 +328,12 @@ def test_parameters_hist():
     visualize.parameter_hist(result_1, "x1", start_indices=list(range(10)))
 
 
-@pytest.mark.parametrize("scale_to_interval", [None, (0, 1)])
-@close_fig
-def test_parameters_hierarchical(scale_to_interval):
+@functools.lru_cache(maxsize=None)
+def _boehm_hierarchical_result():
+    """Optimize the hierarchical Boehm problem.
+
+    The result is cached, callers must not modify it.
+    """
     # obtain a petab problem with hierarchical parameters
     petab_problem = (
         get_Boehm_JProteomeRes2014_hierarchical_petab_corrected_bounds()
@@ -487,6 +354,12 @@ def test_parameters_hierarchical(scale_to_interval):
         n_starts=n_starts,
         progress_bar=False,
     )
+    return problem, result
+
+
+@pytest.mark.parametrize("scale_to_interval", [None, (0, 1)])
+def test_parameters_hierarchical(scale_to_interval):
+    _, result = _boehm_hierarchical_result()
 
     # test a call with hierarchical parameters
     visualize.parameters(
@@ -494,15 +367,13 @@ def test_parameters_hierarchical(scale_to_interval):
     )
 
 
-@close_fig
-def test_optimization_scatter():
-    result = create_optimization_result()
+def test_optimization_scatter(optimization_result):
+    result = optimization_result
     visualize.optimization_scatter(result)
 
 
-@close_fig
-def test_optimization_scatter_with_x_None():
-    result = create_optimization_result()
+def test_optimization_scatter_with_x_None(optimization_result):
+    result = copy.deepcopy(optimization_result)
     # create an optimizerResult with x=None
     optimizer_result = pypesto.OptimizerResult(x=None, fval=np.inf, id="inf")
     result.optimize_result.append(optimize_result=optimizer_result)
@@ -510,14 +381,13 @@ def test_optimization_scatter_with_x_None():
     visualize.optimization_scatter(result)
 
 
-# @close_fig
-def _test_ensemble_dimension_reduction():
+@pytest.mark.skip(reason="Dimension reduction tests are disabled.")
+def test_ensemble_dimension_reduction():
     # creates a test problem
     problem = create_problem(n_parameters=20)
 
     # =========================================================================
     # test ensemble identifiability if some bounds are hit and some aren't
-    my_ensemble = []
     # some magical numbers which create a reasonable plot. Please don't change!
     std = (1, 1, 2, 2, 2.5, 3, 3, 4, 5, 7, 6, 6, 10, 8, 10, 15, 15, 25, 35, 50)
     offset = (
@@ -543,10 +413,13 @@ def _test_ensemble_dimension_reduction():
         -20,
     )
     # create a collection/an ensemble based on these magic numbers
-    for ip in range(len(std)):
-        my_ensemble.append(std[ip] * np.random.rand(100) + offset[ip])
+    rng = np.random.default_rng(0)
+    my_ensemble = (
+        np.array(std)[:, None] * rng.random((len(std), 100))
+        + np.array(offset)[:, None]
+    )
     my_ensemble = ensemble.Ensemble(
-        np.array(my_ensemble), lower_bound=problem.lb, upper_bound=problem.ub
+        my_ensemble, lower_bound=problem.lb, upper_bound=problem.ub
     )
 
     # test plotting from a collection object
@@ -577,14 +450,12 @@ def _test_ensemble_dimension_reduction():
     visualize.ensemble_scatter_lowlevel(pca_components[:, 0:2])
 
 
-@close_fig
 def test_ensemble_identifiability():
     # creates a test problem
     problem = create_problem(n_parameters=100)
 
     # =========================================================================
     # test ensemble identifiability if some bounds are hit and some aren't
-    my_ensemble = []
     # some magical numbers which create a reasonable plot. Please don't change!
     std = (1, 1, 2, 2, 2.5, 3, 3, 4, 5, 7, 6, 6, 10, 8, 10, 15, 15, 25, 35, 50)
     offset = (
@@ -609,11 +480,13 @@ def test_ensemble_identifiability():
         -18,
         -20,
     )
-    # create a collection/an ensemble based on these magic numbers
-    for _ in range(5):
-        for ip in range(len(std)):
-            my_ensemble.append(std[ip] * np.random.rand(500) + offset[ip])
-    my_ensemble = np.array(my_ensemble)
+    # create a collection/an ensemble based on these magic numbers, repeated
+    #  5 times to obtain 100 parameters
+    rng = np.random.default_rng(0)
+    my_ensemble = (
+        np.tile(std, 5)[:, None] * rng.random((5 * len(std), 500))
+        + np.tile(offset, 5)[:, None]
+    )
     my_ensemble = ensemble.Ensemble(
         my_ensemble, lower_bound=problem.lb, upper_bound=problem.ub
     )
@@ -624,23 +497,22 @@ def test_ensemble_identifiability():
     # =========================================================================
     # test ensemble identifiability if no bounds are hit
     # create an ensemble within tight bounds
-    my_ensemble = [
-        (1 + np.cos(ix) ** 2) * np.random.rand(500) - 1.0 + np.sin(ix)
-        for ix in range(100)
-    ]
+    ix = np.arange(100)[:, None]
+    my_ensemble = (
+        (1 + np.cos(ix) ** 2) * rng.random((100, 500)) - 1.0 + np.sin(ix)
+    )
     my_ensemble = ensemble.Ensemble(
-        np.array(my_ensemble), lower_bound=problem.lb, upper_bound=problem.ub
+        my_ensemble, lower_bound=problem.lb, upper_bound=problem.ub
     )
 
     # test plotting from a collection object
     visualize.ensemble_identifiability(my_ensemble)
 
 
-@close_fig
-def test_profiles():
+def test_profiles(profile_result):
     # create the necessary results
-    result_1 = create_profile_result()
-    result_2 = create_profile_result()
+    result_1 = profile_result
+    result_2 = profile_result
 
     # test a standard call
     visualize.profiles(result_1)
@@ -649,10 +521,9 @@ def test_profiles():
     visualize.profiles([result_1, result_2])
 
 
-@close_fig
-def test_profiles_with_options():
+def test_profiles_with_options(profile_result):
     # create the necessary results
-    result = create_profile_result()
+    result = copy.deepcopy(profile_result)
     result.profile_result.list.append([result.profile_result.list[0][1], None])
 
     # alternative figure size and plotting options
@@ -670,7 +541,6 @@ def test_profiles_with_options():
     )
 
 
-@close_fig
 def test_profiles_lowlevel():
     # test empty input
     visualize.profiles_lowlevel([])
@@ -692,7 +562,6 @@ def test_profiles_lowlevel():
     visualize.profiles_lowlevel(fvals)
 
 
-@close_fig
 def test_profile_lowlevel():
     # test empty input
     visualize.profile_lowlevel(fvals=[])
@@ -707,19 +576,17 @@ def test_profile_lowlevel():
     visualize.profile_lowlevel(fvals=fvals)
 
 
-@close_fig
-def test_profile_cis():
+def test_profile_cis(profile_result):
     """Test the profile approximate confidence interval visualization."""
-    result = create_profile_result()
+    result = profile_result
     visualize.profile_cis(result, confidence_level=0.99)
     visualize.profile_cis(result, show_bounds=True, profile_indices=[0])
 
 
-@close_fig
-def test_optimizer_history():
+def test_optimizer_history(optimization_history):
     # create the necessary results
-    result_1 = create_optimization_history()
-    result_2 = create_optimization_history()
+    result_1 = optimization_history
+    result_2 = optimization_history
 
     # test a standard call
     visualize.optimizer_history(result_1)
@@ -728,11 +595,10 @@ def test_optimizer_history():
     visualize.optimizer_history([result_1, result_2])
 
 
-@close_fig
-def test_optimizer_history_with_options():
+def test_optimizer_history_with_options(optimization_history):
     # create the necessary results
-    result_1 = create_optimization_history()
-    result_2 = create_optimization_history()
+    result_1 = optimization_history
+    result_2 = optimization_history
 
     # alternative figure size and plotting options
     (_, _, ref3, _, ref_point) = create_plotting_options()
@@ -773,16 +639,14 @@ def test_optimizer_history_with_options():
     )
 
 
-@close_fig
 def test_optimizer_history_lowlevel():
     # test empty input
     visualize.optimizer_history_lowlevel([])
 
     # pass numpy array
-    x_vals = np.array(list(range(10)))
-    y_vals = 11.0 * np.ones(10) - x_vals
-    vals1 = np.array([x_vals, y_vals])
-    vals2 = np.array([0.1 * np.ones(10) + x_vals, np.ones(10) + y_vals])
+    x_vals = np.arange(10, dtype=float)
+    vals1 = np.stack([x_vals, 11.0 - x_vals])
+    vals2 = vals1 + np.array([[0.1], [1.0]])
     vals = [vals1, vals2]
 
     # test with numpy arrays
@@ -793,7 +657,6 @@ def test_optimizer_history_lowlevel():
     visualize.optimizer_history_lowlevel(vals)
 
 
-@close_fig
 def test_optimization_stats():
     """Test pypesto.visualize.optimization_stats"""
 
@@ -868,10 +731,11 @@ def test_optimization_stats():
     )
 
 
-@close_fig
-def test_optimize_convergence():
-    result = create_optimization_result()
-    result_nan = create_optimization_result_nan_inf()
+def test_optimize_convergence(
+    optimization_result, optimization_result_nan_inf
+):
+    result = optimization_result
+    result_nan = optimization_result_nan_inf
 
     visualize.optimizer_convergence(result)
     visualize.optimizer_convergence(result_nan)
@@ -962,10 +826,10 @@ def test_reference_points():
     visualize.create_references(references=ref_list_2, x=ref2[0], fval=ref2[1])
 
 
-def test_process_result_list():
+def test_process_result_list(optimization_result):
     # create the necessary results
-    result_1 = create_optimization_result()
-    result_2 = create_optimization_result()
+    result_1 = optimization_result
+    result_2 = optimization_result
 
     # Test empty arguments
     visualize.process_result_list([])
@@ -981,32 +845,9 @@ def test_process_result_list():
     visualize.process_result_list(res_list)
 
 
-def create_sampling_result():
-    """Create a result object containing sample results."""
-    result = create_optimization_result()
-    n_chain = 2
-    n_iter = 100
-    n_par = len(result.optimize_result.x[0])
-    trace_neglogpost = np.random.randn(n_chain, n_iter)
-    trace_neglogprior = np.zeros((n_chain, n_iter))
-    trace_x = np.random.randn(n_chain, n_iter, n_par)
-    betas = np.array([1, 0.1])
-    sample_result = pypesto.McmcPtResult(
-        trace_neglogpost=trace_neglogpost,
-        trace_neglogprior=trace_neglogprior,
-        trace_x=trace_x,
-        betas=betas,
-        burn_in=10,
-    )
-    result.sample_result = sample_result
-
-    return result
-
-
-@close_fig
-def test_sampling_fval_traces():
+def test_sampling_fval_traces(sampling_result):
     """Test pypesto.visualize.sampling_fval_traces"""
-    result = create_sampling_result()
+    result = sampling_result
     visualize.sampling_fval_traces(result)
     # call with custom arguments
     visualize.sampling_fval_traces(
@@ -1014,10 +855,9 @@ def test_sampling_fval_traces():
     )
 
 
-@close_fig
-def test_sampling_parameter_traces():
+def test_sampling_parameter_traces(sampling_result):
     """Test pypesto.visualize.sampling_parameter_traces"""
-    result = create_sampling_result()
+    result = sampling_result
     visualize.sampling_parameter_traces(result)
     # call with custom arguments
     visualize.sampling_parameter_traces(
@@ -1025,19 +865,17 @@ def test_sampling_parameter_traces():
     )
 
 
-@close_fig
-def test_sampling_scatter():
+def test_sampling_scatter(sampling_result):
     """Test pypesto.visualize.sampling_scatter"""
-    result = create_sampling_result()
+    result = sampling_result
     visualize.sampling_scatter(result)
     # call with custom arguments
     visualize.sampling_scatter(result, i_chain=1, stepsize=5, size=(10, 10))
 
 
-@close_fig
-def test_sampling_1d_marginals():
+def test_sampling_1d_marginals(sampling_result):
     """Test pypesto.visualize.sampling_1d_marginals"""
-    result = create_sampling_result()
+    result = sampling_result
     visualize.sampling_1d_marginals(result)
     # call with custom arguments
     visualize.sampling_1d_marginals(
@@ -1050,10 +888,9 @@ def test_sampling_1d_marginals():
     )
 
 
-@close_fig
-def test_sampling_parameter_cis():
+def test_sampling_parameter_cis(sampling_result):
     """Test pypesto.visualize.sampling_parameter_cis"""
-    result = create_sampling_result()
+    result = sampling_result
     visualize.sampling_parameter_cis(result)
     # call with custom arguments
     visualize.sampling_parameter_cis(
@@ -1061,7 +898,6 @@ def test_sampling_parameter_cis():
     )
 
 
-@close_fig
 def test_sampling_prediction_trajectories():
     """Test pypesto.visualize.sampling_prediction_trajectories"""
     credibility_interval_levels = [99, 68]
@@ -1091,44 +927,42 @@ def test_sampling_prediction_trajectories():
         progress_bar=False,
     )
 
+    # compute the percentiles of both credibility levels only once
+    summary = ensemble_prediction.compute_summary(
+        percentiles_list=[0.5, 16.0, 84.0, 99.5]
+    )
+
     # Plot by
     visualize.sampling_prediction_trajectories(
         ensemble_prediction,
         levels=credibility_interval_levels,
         groupby=pypesto.C.CONDITION,
+        summary=summary,
     )
+    plt.close("all")
     visualize.sampling_prediction_trajectories(
         ensemble_prediction,
         levels=credibility_interval_levels,
         size=(10, 10),
         groupby=pypesto.C.OUTPUT,
+        summary=summary,
     )
 
+    # the summary needs to contain the percentiles of the requested levels
+    with pytest.raises(ValueError, match="lacks the percentiles"):
+        visualize.sampling_prediction_trajectories(
+            ensemble_prediction, levels=[95], summary=summary
+        )
 
-@close_fig
-def test_visualize_optimized_model_fit():
-    """Test pypesto.visualize.visualize_optimized_model_fit"""
-    current_path = os.path.dirname(os.path.realpath(__file__))
-    dir_path = os.path.abspath(
-        os.path.join(current_path, "..", "..", "doc", "example")
-    )
 
-    # import to petab
-    petab_problem = petab.Problem.from_yaml(
-        os.path.join(
-            dir_path, "conversion_reaction", "conversion_reaction.yaml"
-        )
-    )
-    # import to pypesto
-    importer = pypesto.petab.PetabImporter(petab_problem)
-    # create problem
-    problem = importer.create_problem()
+def test_visualize_optimized_model_fit(
+    conversion_reaction_problem, conversion_reaction_result
+):
+    """Test pypesto.visualize.visualize_optimized_model_fit"""
+    from pypesto.visualize.model_fit import visualize_optimized_model_fit
 
-    result = optimize.minimize(
-        problem=problem,
-        n_starts=1,
-        progress_bar=False,
-    )
+    petab_problem, problem = conversion_reaction_problem
+    result = conversion_reaction_result
 
     # test call of visualize_optimized_model_fit
     visualize_optimized_model_fit(
@@ -1138,56 +972,66 @@ def test_visualize_optimized_model_fit():
     )
 
 
-@close_fig
-def test_time_trajectory_model():
+def test_time_trajectory_model(conversion_reaction_result):
     """Test pypesto.visualize.time_trajectory_model"""
-    current_path = os.path.dirname(os.path.realpath(__file__))
-    dir_path = os.path.abspath(
-        os.path.join(current_path, "..", "..", "doc", "example")
-    )
+    from pypesto.visualize.model_fit import time_trajectory_model
 
-    # import to petab
-    petab_problem = petab.Problem.from_yaml(
-        os.path.join(
-            dir_path, "conversion_reaction", "conversion_reaction.yaml"
-        )
-    )
-    # import to pypesto
-    importer = pypesto.petab.PetabImporter(petab_problem)
-    # create problem
-    problem = importer.create_problem()
+    # test call of time_trajectory_model
+    time_trajectory_model(result=conversion_reaction_result)
 
-    result = optimize.minimize(
-        problem=problem,
-        n_starts=1,
-        progress_bar=False,
-    )
 
-    # test call of time_trajectory_model
-    time_trajectory_model(result=result)
+# Runs SACESS and plots its history. The workers are forked from a server
+#  process that has already imported pypesto, instead of importing it in
+#  every newly spawned worker. The forkserver and its preloaded modules
+#  persist for the lifetime of the process that started them.
+SACESS_HISTORY_SCRIPT = """
+import logging
+import multiprocessing
+
+from pypesto.optimize.ess.sacess import SacessOptimizer
+from pypesto.visualize.optimizer_history import sacess_history
+from test.util import create_problem
+
+mp_start_method = "spawn"
+if "forkserver" in multiprocessing.get_all_start_methods():
+    multiprocessing.set_forkserver_preload(["pypesto.optimize.ess.sacess"])
+    mp_start_method = "forkserver"
+
+# fides uses the Hessian by default
+problem = create_problem(with_hess=True)
+sacess = SacessOptimizer(
+    max_walltime_s=1,
+    num_workers=2,
+    sacess_loglevel=logging.WARNING,
+    mp_start_method=mp_start_method,
+)
+sacess.minimize(problem)
+sacess_history(sacess.histories)
+"""
 
 
-@close_fig
 def test_sacess_history():
     """Test pypesto.visualize.optimizer_history.sacess_history"""
-    from pypesto.optimize.ess.sacess import SacessOptimizer
-    from pypesto.visualize.optimizer_history import sacess_history
-
-    problem = create_problem()
-    sacess = SacessOptimizer(
-        max_walltime_s=1, num_workers=2, sacess_loglevel=logging.WARNING
+    # run in a separate process, to not leave a forkserver with preloaded
+    #  modules behind
+    root_dir = os.path.join(os.path.dirname(__file__), "..", "..")
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [os.path.abspath(root_dir), env.get("PYTHONPATH")])
+    )
+    subprocess.check_call(
+        [sys.executable, "-c", SACESS_HISTORY_SCRIPT],  # noqa: S603
+        cwd=root_dir,
+        env=env,
     )
-    sacess.minimize(problem)
-    sacess_history(sacess.histories)
 
 
 @pytest.mark.parametrize(
-    "result_creation",
-    [create_optimization_result, create_optimization_result_nan_inf],
+    "result_fixture",
+    ["optimization_result", "optimization_result_nan_inf"],
 )
-@close_fig
-def test_parameters_correlation_matrix(result_creation):
+def test_parameters_correlation_matrix(result_fixture, request):
     """Test pypesto.visualize.parameters_correlation_matrix"""
-    result = result_creation()
+    result = request.getfixturevalue(result_fixture)
 
     visualize.parameters_correlation_matrix(result)